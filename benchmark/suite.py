@@ -0,0 +1,276 @@
+"""
+Benchmark suite that measures the running time of the public operations
+(for several batch sizes) and the time taken to import the library. The
+results can be saved in JSON format and compared with the results of an
+earlier run (the baseline), in which case the exit status is nonzero if
+any operation is slower than in the baseline by more than the threshold:
+
+.. code-block:: bash
+
+    python benchmark/suite.py --sizes 1 16 64 --output baseline.json
+    python benchmark/suite.py --sizes 1 16 64 --baseline baseline.json --threshold 0.1
+
+Each result is the smallest running time (in seconds) over several runs of
+an operation applied to a batch of inputs of the specified size. The
+numbers of field operations performed by each operation can also be included
+in the results (as a cost model for predicting running times):
+
+.. code-block:: bash
+
+    python benchmark/suite.py --sizes 1 --operations scalar_mult mul_l --counts
+"""
+from __future__ import annotations
+from typing import Optional, Sequence, Dict, Callable
+import sys
+import os
+import platform
+import subprocess
+import argparse
+import hashlib
+import json
+import time
+
+from ge25519 import \
+    ge25519, ge25519_p3, ge25519_p1p1, ge25519_precomp, ge25519_cached, ed25519
+
+try:
+    import numpy as np
+    from ge25519.ge25519_batch import ge25519_p3_batch # pylint: disable=ungrouped-imports
+except ImportError:
+    np = None
+
+class inputs: # pylint: disable=invalid-name,too-few-public-methods
+    """
+    Deterministic inputs of every kind used by the operations (for a batch
+    of the specified size).
+    """
+    def __init__(self: inputs, count: int):
+        self.hashes = [hashlib.sha512(i.to_bytes(8, 'little')).digest() for i in range(count)]
+        self.scalars = [h[:31] + bytes([h[31] & 15]) for h in self.hashes]
+        self.points = [ge25519_p3.from_uniform(h[32:]) for h in self.hashes]
+        self.encodings = ge25519_p3.to_bytes_many(self.points)
+        self.encodings_ristretto255 = ge25519_p3.to_bytes_ristretto255_many(self.points)
+        self.keys = ed25519.keygen_many([h[:32] for h in self.hashes])
+        self.signatures = [k.sign(h) for (k, h) in zip(self.keys, self.hashes)]
+
+def _batch(bss: Sequence[bytes]) -> np.ndarray:
+    return np.frombuffer(b''.join(bss), dtype=np.uint8).reshape(len(bss), 32)
+
+# Each operation builds a function (without arguments) that applies the
+# operation to every entry in a batch of inputs.
+OPERATIONS: Dict[str, Callable[[inputs], Callable[[], object]]] = {
+    'from_bytes': lambda x: lambda: [ge25519_p3.from_bytes(b) for b in x.encodings],
+    'from_bytes_ristretto255': lambda x: lambda: [
+        ge25519_p3.from_bytes_ristretto255(b) for b in x.encodings_ristretto255
+    ],
+    'from_hash_ristretto255': lambda x: lambda: [
+        ge25519_p3.from_hash_ristretto255(h) for h in x.hashes
+    ],
+    'from_uniform': lambda x: lambda: [ge25519_p3.from_uniform(h[:32]) for h in x.hashes],
+    'to_bytes': lambda x: lambda: [p.to_bytes() for p in x.points],
+    'to_bytes_many': lambda x: lambda: ge25519_p3.to_bytes_many(x.points),
+    'to_bytes_ristretto255': lambda x: lambda: [p.to_bytes_ristretto255() for p in x.points],
+    'double_to_bytes_ristretto255_many': lambda x: lambda: \
+        ge25519_p3.double_to_bytes_ristretto255_many(x.points),
+    'is_canonical_many': lambda x: lambda: ge25519.is_canonical_many(b''.join(x.encodings)),
+    'has_small_order_many': lambda x: lambda: ge25519.has_small_order_many(b''.join(x.encodings)),
+    'is_on_main_subgroup': lambda x: lambda: [p.is_on_main_subgroup() for p in x.points],
+    'is_on_main_subgroup_many': lambda x: lambda: ge25519_p3.is_on_main_subgroup_many(x.points),
+    'mul_l': lambda x: lambda: [p.mul_l() for p in x.points],
+    'add': lambda x: lambda: [
+        ge25519_p3.from_p1p1(ge25519_p1p1.add(p, ge25519_cached.from_p3(p)))
+        for p in x.points
+    ],
+    'madd': lambda x: lambda: [
+        ge25519_p3.from_p1p1(ge25519_p1p1.madd(p, ge25519_precomp.zero()))
+        for p in x.points
+    ],
+    'dbl': lambda x: lambda: [ge25519_p3.from_p1p1(p.dbl()) for p in x.points],
+    'scalar_mult': lambda x: lambda: [p.scalar_mult(s) for (p, s) in zip(x.points, x.scalars)],
+    'scalar_mult_vartime': lambda x: lambda: [
+        p.scalar_mult_vartime(s) for (p, s) in zip(x.points, x.scalars)
+    ],
+    'scalar_mult_base': lambda x: lambda: [ge25519_p3.scalar_mult_base(s) for s in x.scalars],
+    'double_scalar_mult_vartime': lambda x: lambda: [
+        ge25519_p3.double_scalar_mult_vartime(s, p, s) for (p, s) in zip(x.points, x.scalars)
+    ],
+    'multiscalar_mult': lambda x: lambda: ge25519_p3.multiscalar_mult(x.scalars, x.points),
+    'multiscalar_mult_vartime': lambda x: lambda: \
+        ge25519_p3.multiscalar_mult_vartime(x.scalars, x.points),
+    'ed25519.keygen_many': lambda x: lambda: ed25519.keygen_many([h[:32] for h in x.hashes]),
+    'ed25519.sign': lambda x: lambda: [k.sign(h) for (k, h) in zip(x.keys, x.hashes)],
+    'ed25519.verify': lambda x: lambda: [
+        ed25519.verify(s, h, k.public_key)
+        for (s, h, k) in zip(x.signatures, x.hashes, x.keys)
+    ],
+    'ed25519.verify_batch': lambda x: lambda: ed25519.verify_batch(
+        x.signatures, x.hashes, [k.public_key for k in x.keys]
+    )
+}
+
+if np is not None:
+    def _from_bytes_batch(x: inputs) -> Callable[[], object]:
+        a = _batch(x.encodings)
+        return lambda: ge25519_p3_batch.from_bytes(a)
+
+    def _from_bytes_ristretto255_batch(x: inputs) -> Callable[[], object]:
+        a = _batch(x.encodings_ristretto255)
+        return lambda: ge25519_p3_batch.from_bytes_ristretto255(a)
+
+    def _to_bytes_batch(x: inputs) -> Callable[[], object]:
+        return ge25519_p3_batch.from_points(x.points).to_bytes
+
+    def _to_bytes_ristretto255_batch(x: inputs) -> Callable[[], object]:
+        return ge25519_p3_batch.from_points(x.points).to_bytes_ristretto255
+
+    def _scalar_mult_base_batch(x: inputs) -> Callable[[], object]:
+        a = _batch(x.scalars)
+        return lambda: ge25519_p3_batch.scalar_mult_base(a)
+
+    OPERATIONS.update({
+        'batch.from_bytes': _from_bytes_batch,
+        'batch.from_bytes_ristretto255': _from_bytes_ristretto255_batch,
+        'batch.to_bytes': _to_bytes_batch,
+        'batch.to_bytes_ristretto255': _to_bytes_ristretto255_batch,
+        'batch.scalar_mult_base': _scalar_mult_base_batch
+    })
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """
+    Return the smallest number of seconds taken by a function over the
+    specified number of runs.
+    """
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+def measure_import(repeat: int) -> float:
+    """
+    Return the smallest number of seconds taken to import the library in a
+    new interpreter (over the specified number of runs).
+    """
+    script = (
+        'import time; start = time.perf_counter(); import ge25519; ' +
+        'print(time.perf_counter() - start)'
+    )
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    return min(
+        float(subprocess.run(
+            [sys.executable, '-c', script],
+            check=True, capture_output=True, text=True, env=environment
+        ).stdout)
+        for _ in range(repeat)
+    )
+
+def run(
+        operations: Sequence[str],
+        sizes: Sequence[int],
+        repeat: int,
+        field: Optional[str] = None,
+        counts: bool = False
+    ) -> dict:
+    """
+    Measure every operation for every batch size and return the results
+    (along with a description of the environment). If requested, the field
+    operations performed in one additional (untimed) run are also counted.
+    """
+    results = {'import': {'size': 1, 'seconds': measure_import(repeat)}}
+    with ge25519.using_field(field):
+        for size in sizes:
+            batch = inputs(size)
+            for name in operations:
+                function = OPERATIONS[name](batch)
+                function() # Warm up (e.g., load precomputed tables).
+                results[name + '/' + str(size)] = {
+                    'size': size,
+                    'seconds': measure(function, repeat)
+                }
+                if counts:
+                    with ge25519.counting() as operations_counted:
+                        function()
+                    results[name + '/' + str(size)]['counts'] = dict(operations_counted)
+
+    return {
+        'environment': {
+            'python': platform.python_implementation() + ' ' + platform.python_version(),
+            'platform': platform.platform(),
+            'field': field or 'default',
+            'numpy': np is not None
+        },
+        'results': results
+    }
+
+def compare(results: dict, baseline: dict, threshold: float) -> Sequence[str]:
+    """
+    Print a comparison of the results with those of a baseline and return
+    the names of all results that are slower than in the baseline by more
+    than the threshold (a fraction of the running time in the baseline).
+    """
+    regressions = []
+    if baseline.get('environment') != results['environment']:
+        print('warning: the baseline was measured in a different environment', file=sys.stderr)
+
+    print(f"{'operation':<44} {'baseline':>12} {'current':>12} {'change':>8}", file=sys.stderr)
+    for (name, result) in results['results'].items():
+        if name in baseline['results']:
+            (before, after) = (baseline['results'][name]['seconds'], result['seconds'])
+            change = (after - before) / before if before > 0 else 0.0
+            regressed = change > threshold
+            if regressed:
+                regressions.append(name)
+            print(
+                f'{name:<44} {before:>12.6f} {after:>12.6f} {change:>+8.1%}' +
+                (' regression' if regressed else ''),
+                file=sys.stderr
+            )
+
+    return regressions
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmark suite, save or print the results, and compare them
+    with a baseline (if one is supplied).
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument(
+        '--operations', nargs='+', default=list(OPERATIONS), choices=list(OPERATIONS),
+        metavar='OPERATION', help='operations to measure (by default, all operations)'
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1, 16, 64], help='batch sizes'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs (best is kept)')
+    parser.add_argument('--field', default=None, help='name of the field element class')
+    parser.add_argument(
+        '--counts', action='store_true',
+        help='include the numbers of field operations performed by each operation'
+    )
+    parser.add_argument('--output', default=None, help='file to which results are written')
+    parser.add_argument('--baseline', default=None, help='file containing baseline results')
+    parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='largest acceptable slowdown relative to the baseline (as a fraction)'
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.operations, args.sizes, args.repeat, args.field, args.counts)
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        if len(regressions) > 0:
+            print(str(len(regressions)) + ' regression(s) found', file=sys.stderr)
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
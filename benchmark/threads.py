@@ -0,0 +1,91 @@
+"""
+Benchmark that measures the throughput of a group operation applied to a
+batch of inputs by a pool of worker threads (see :obj:`ge25519.ge25519_pool`)
+for a range of thread counts. The throughput is expected to scale with the
+number of threads (up to the number of CPUs) only in free-threaded builds of
+CPython, in which the global interpreter lock is disabled:
+
+.. code-block:: bash
+
+    python benchmark/threads.py --threads 1 2 4 8 --count 512 --field int
+"""
+from __future__ import annotations
+from typing import Optional, Sequence, Callable
+import sys
+import os
+import argparse
+import hashlib
+import time
+
+from ge25519 import ge25519_p3
+from ge25519.ge25519_pool import ge25519_pool
+
+def inputs(operation: str, count: int) -> Sequence[Sequence[bytes]]:
+    """
+    Build the arguments (sequences of binary representations) for a batch of
+    the specified operation.
+    """
+    digests = [hashlib.sha512(i.to_bytes(8, 'little')).digest() for i in range(count)]
+    scalars = [d[:31] + bytes(1) for d in digests]
+    if operation == 'scalar_mult':
+        return (scalars, [ge25519_p3.from_uniform(d[32:]).to_bytes() for d in digests])
+    if operation == 'scalar_mult_ristretto255':
+        return (scalars, [ge25519_p3.from_hash_ristretto255(d) for d in digests])
+    if operation == 'from_hash_ristretto255':
+        return (digests,)
+    return (scalars,)
+
+def measure(function: Callable[..., Sequence[bytes]], arguments: Sequence[Sequence[bytes]]) -> float:
+    """
+    Return the number of seconds taken to apply a batch operation.
+    """
+    start = time.perf_counter()
+    function(*arguments)
+    return time.perf_counter() - start
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    Run the benchmark and print one line of results for each thread count.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument(
+        '--threads', type=int, nargs='+',
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help='numbers of worker threads'
+    )
+    parser.add_argument(
+        '--operation', default='scalar_mult_base',
+        choices=[
+            'scalar_mult', 'scalar_mult_ristretto255',
+            'scalar_mult_base', 'from_hash_ristretto255'
+        ],
+        help='operation applied to every input'
+    )
+    parser.add_argument('--count', type=int, default=256, help='number of inputs in the batch')
+    parser.add_argument('--field', default=None, help='name of the field element class')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs (best is kept)')
+    args = parser.parse_args(argv)
+
+    arguments = inputs(args.operation, args.count)
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(
+        'operation: ' + args.operation + ', inputs: ' + str(args.count) +
+        ', field: ' + str(args.field or 'default') +
+        ', GIL: ' + ('enabled' if gil else 'disabled')
+    )
+    print(f"{'threads':>8} {'seconds':>12} {'per second':>12} {'speedup':>8}")
+
+    baseline = None
+    for threads in args.threads:
+        with ge25519_pool(processes=threads, threads=True, field=args.field) as pool:
+            function = getattr(pool, args.operation)
+            function(*[a[:threads] for a in arguments]) # Warm up every worker.
+            seconds = min(measure(function, arguments) for _ in range(args.repeat))
+        baseline = baseline or seconds
+        print(
+            f'{threads:>8} {seconds:>12.4f} {args.count / seconds:>12.1f} ' +
+            f'{baseline / seconds:>8.2f}'
+        )
+
+if __name__ == '__main__':
+    main()
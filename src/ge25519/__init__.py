@@ -2,4 +2,7 @@
 from ge25519.ge25519 import \
     ge25519, \
     ge25519_p2, ge25519_p3, ge25519_p1p1, \
-    ge25519_precomp, ge25519_cached
+    ge25519_precomp, ge25519_cached, \
+    ge25519_precomp_table
+from ge25519.ed25519 import ed25519_key, ed25519
+from ge25519.fe25519_int import fe25519_int
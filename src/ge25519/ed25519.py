@@ -0,0 +1,243 @@
+"""
+Pure-Python implementation of Ed25519 key generation, signing, and
+signature verification (including batch key generation and batch
+verification) built on the group element data structures and operations
+in :obj:`ge25519.ge25519`.
+"""
+from __future__ import annotations
+from typing import Optional, Tuple, Sequence
+import os
+import hashlib
+
+from ge25519.ge25519 import ge25519, ge25519_p2, ge25519_p3, ge25519_p1p1, ge25519_cached, \
+    _length
+
+# Constants used within this module.
+_L = (2 ** 252) + 27742317777372353535851937790883648493 # Order of the main subgroup.
+_B = bytes([0x58] + [0x66] * 31) # Binary representation of the base point.
+
+def _scalar(n: int) -> bytes:
+    """
+    Canonical binary representation of an integer modulo the order of
+    the main subgroup.
+    """
+    return (n % _L).to_bytes(32, 'little')
+
+class ed25519_key:
+    """
+    Expanded Ed25519 key that caches the clamped secret scalar, the prefix
+    used to derive nonces, and the binary representation of the public key
+    (so that none of these need to be recomputed when signing).
+
+    >>> key = ed25519.keygen(bytes.fromhex(
+    ...     '9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60'
+    ... ))
+    >>> key.public_key.hex()
+    'd75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a'
+    >>> ed25519.verify(key.sign(b'abc'), b'abc', key.public_key)
+    True
+    """
+    def __init__(
+            self: ed25519_key,
+            seed: bytes,
+            scalar: bytes,
+            prefix: bytes,
+            public_key: bytes
+        ):
+        self.seed = seed
+        self.scalar = scalar
+        self.prefix = prefix
+        self.public_key = public_key
+
+    @staticmethod
+    def _expand(seed: bytes) -> Tuple[bytes, bytes]:
+        # Derive the clamped secret scalar and the prefix from a 32-byte seed.
+        h = hashlib.sha512(seed).digest()
+        scalar = bytes([h[0] & 248]) + h[1:31] + bytes([(h[31] & 127) | 64])
+        return (scalar, h[32:])
+
+    @staticmethod
+    def from_seed(seed: bytes) -> ed25519_key:
+        """
+        Construct an expanded key from a 32-byte seed.
+        """
+        (scalar, prefix) = ed25519_key._expand(seed)
+        public_key = ge25519_p3.scalar_mult_base(scalar).to_bytes()
+        return ed25519_key(seed, scalar, prefix, public_key)
+
+    def sign(self: ed25519_key, message: bytes) -> bytes:
+        """
+        Create a 64-byte signature on a message.
+        """
+        digest = hashlib.sha512(self.prefix + message).digest()
+        r = int.from_bytes(digest, 'little') % _L
+        R = ge25519_p3.scalar_mult_base(_scalar(r)).to_bytes()
+        h = ed25519._challenge(R, message, self.public_key) # pylint: disable=protected-access
+        return R + _scalar(r + h * int.from_bytes(self.scalar, 'little'))
+
+class ed25519:
+    """
+    Ed25519 key generation and signature verification (signing is performed
+    using the :obj:`ed25519_key` objects returned by :obj:`keygen` and
+    :obj:`keygen_many`).
+
+    All verification methods check the cofactored verification equation
+    ``8*s*B == 8*R + 8*h*A`` (where ``B`` is the base point and ``h`` is the
+    challenge derived from ``R``, ``A``, and the message). Thus, the result
+    of batch verification for a signature is always consistent with that of
+    :obj:`verify` for the same signature. As in libsodium, signatures with a
+    non-canonical scalar ``s`` and signatures or public keys containing a
+    non-canonical or small-order point are rejected.
+
+    >>> pk = bytes.fromhex(
+    ...     'd75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a'
+    ... )
+    >>> sig = bytes.fromhex(
+    ...     'e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e06522490155'
+    ...     '5fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b'
+    ... )
+    >>> ed25519.verify(sig, b'', pk)
+    True
+    >>> ed25519.verify(sig, b'x', pk)
+    False
+    >>> ed25519.verify_batch([sig, sig], [b'', b'x'], [pk, pk])
+    [True, False]
+    """
+    @staticmethod
+    def keygen(seed: Optional[bytes] = None) -> ed25519_key:
+        """
+        Generate an expanded key from a 32-byte seed (or from a random seed
+        if no seed is supplied).
+        """
+        return ed25519_key.from_seed(os.urandom(32) if seed is None else seed)
+
+    @staticmethod
+    def keygen_many(seeds: Sequence[bytes]) -> Sequence[ed25519_key]:
+        """
+        Generate an expanded key from each 32-byte seed in a sequence, with
+        results identical to those of :obj:`keygen`. The binary representations
+        of all public keys are computed using
+        :obj:`~ge25519.ge25519.ge25519_p3.to_bytes_many` (sharing a single field
+        inversion).
+        """
+        expanded = [ed25519_key._expand(seed) for seed in seeds] # pylint: disable=protected-access
+        public_keys = ge25519_p3.to_bytes_many([
+            ge25519_p3.scalar_mult_base(scalar) for (scalar, _) in expanded
+        ])
+        return [
+            ed25519_key(seed, scalar, prefix, public_key)
+            for (seed, (scalar, prefix), public_key) in zip(seeds, expanded, public_keys)
+        ]
+
+    @staticmethod
+    def _decode(
+            signature: bytes,
+            public_key: bytes
+        ) -> Optional[Tuple[ge25519_p3, ge25519_p3, int]]:
+        # Decode the points ``R`` and ``A`` and the scalar ``s``, or return
+        # ``None`` if any of the components is not acceptable.
+        if len(signature) != 64 or len(public_key) != 32:
+            return None
+
+        s = int.from_bytes(signature[32:], 'little')
+        if s >= _L:
+            return None
+
+        for bs in (signature[:32], public_key):
+            if ge25519.is_canonical(bs) == 0 or ge25519.has_small_order(bs) != 0:
+                return None
+
+        R = ge25519_p3.from_bytes(signature[:32])
+        A = ge25519_p3.from_bytes(public_key)
+        if R.root_check != 0 or A.root_check != 0:
+            return None
+
+        return (R, A, s)
+
+    @staticmethod
+    def _challenge(signature: bytes, message: bytes, public_key: bytes) -> int:
+        digest = hashlib.sha512(signature[:32] + public_key + message).digest()
+        return int.from_bytes(digest, 'little') % _L
+
+    @staticmethod
+    def _is_zero_cofactored(p: ge25519_p3) -> bool:
+        # Determine whether the product of the cofactor and an element is zero.
+        r = ge25519_p2.from_p1p1(ge25519_p2.from_p3(p).dbl())
+        r = ge25519_p2.from_p1p1(r.dbl())
+        r = ge25519_p2.from_p1p1(r.dbl()) # *8
+        return bool(r.X.is_zero() & (r.Y - r.Z).is_zero())
+
+    @staticmethod
+    def verify(signature: bytes, message: bytes, public_key: bytes) -> bool:
+        """
+        Verify a 64-byte signature on a message using a 32-byte public key.
+        """
+        decoded = ed25519._decode(signature, public_key)
+        if decoded is None:
+            return False
+
+        (R, A, s) = decoded
+        h = ed25519._challenge(signature, message, public_key)
+        p = ge25519_p3.double_scalar_mult_vartime(_scalar(-h), A, _scalar(s)) # s*B - h*A
+        p = ge25519_p3.from_p1p1(ge25519_p1p1.sub(p, ge25519_cached.from_p3(R)))
+        return ed25519._is_zero_cofactored(p)
+
+    @staticmethod
+    def verify_batch(
+            signatures: Sequence[bytes],
+            messages: Sequence[bytes],
+            public_keys: Sequence[bytes]
+        ) -> Sequence[bool]:
+        """
+        Verify each signature on its corresponding message using its
+        corresponding public key, with results identical to those of
+        :obj:`verify` (except with probability at most ``2**(-128)``).
+
+        The verification equations of all acceptable signatures are combined
+        using random 128-bit coefficients ``z`` and checked using a single
+        invocation of :obj:`~ge25519.ge25519.ge25519_p3.multiscalar_mult_vartime`
+        (*i.e.*, ``8*(sum(z*R) + sum((z*h)*A) - sum(z*s)*B) == 0``). If this
+        check fails, each signature is verified individually so that the
+        invalid signatures can be identified.
+        """
+        if not len(signatures) == len(messages) == len(public_keys):
+            raise ValueError(
+                'number of signatures, messages, and public keys must match'
+            )
+
+        decoded = [
+            ed25519._decode(signature, public_key)
+            for (signature, public_key) in zip(signatures, public_keys)
+        ]
+
+        b = 0 # Coefficient of the base point.
+        (scalars, points) = ([], [])
+        for (signature, message, public_key, d) in zip(
+            signatures, messages, public_keys, decoded
+        ):
+            if d is not None:
+                (R, A, s) = d
+                h = ed25519._challenge(signature, message, public_key)
+                z = int.from_bytes(os.urandom(16), 'little') # Random 128-bit coefficient.
+                b += z * s
+                scalars.extend([_scalar(z), _scalar(z * h)])
+                points.extend([R, A])
+
+        p = ge25519_p3.multiscalar_mult_vartime(
+            [_scalar(-b)] + scalars,
+            [ge25519_p3.from_bytes(_B)] + points
+        )
+        if ed25519._is_zero_cofactored(p):
+            return [d is not None for d in decoded]
+
+        return [
+            d is not None and ed25519.verify(signature, message, public_key)
+            for (signature, message, public_key, d) in zip(
+                signatures, messages, public_keys, decoded
+            )
+        ]
+
+# Declare the entry points that report to registered hooks.
+ge25519._entry_point(ed25519_key, ['sign']) # pylint: disable=protected-access
+ge25519._entry_point(ed25519, ['keygen', 'verify']) # pylint: disable=protected-access
+ge25519._entry_point(ed25519, ['keygen_many', 'verify_batch'], _length) # pylint: disable=protected-access
@@ -0,0 +1,33 @@
+"""
+Pure-Python data structure for working with Ed25519 field elements that
+are represented as `gmpy2 <https://pypi.org/project/gmpy2>`__ integers
+(this module can only be imported if that optional library is installed).
+"""
+from __future__ import annotations
+from gmpy2 import mpz # pylint: disable=no-name-in-module
+
+from ge25519.fe25519_int import fe25519_int
+
+class fe25519_gmpy2(fe25519_int):
+    """
+    Class for field elements that are represented as a single
+    :obj:`gmpy2.mpz` integer (always reduced modulo the order of the field).
+    The public interface of this class is identical to that of
+    :obj:`~ge25519.fe25519_int.fe25519_int` and all operations are inherited
+    from that class, but arithmetic on large integers is delegated to the GMP
+    library. As with :obj:`~ge25519.fe25519_int.fe25519_int`, the operations
+    of this class are not constant-time.
+
+    >>> two = fe25519_gmpy2.one() + fe25519_gmpy2.one()
+    >>> (two * two.invert()) == fe25519_gmpy2.one()
+    True
+    >>> fe25519_gmpy2.from_bytes(two.to_bytes())
+    fe25519_gmpy2(2)
+    """
+    __slots__ = ()
+    _int = mpz
+
+for _name in [
+    'd', 'd2', 'sqrtm1', 'invsqrtamd', 'onemsqd', 'sqdmone', 'sqrtadm1', 'curve25519_A'
+]:
+    setattr(fe25519_gmpy2, _name, fe25519_gmpy2(mpz(getattr(fe25519_int, _name).n)))
@@ -0,0 +1,269 @@
+"""
+Pure-Python data structure for working with Ed25519 field elements that
+are represented as native Python integers (as an alternative to the
+`fe25519 <https://pypi.org/project/fe25519>`__ library).
+"""
+from __future__ import annotations
+from typing import Tuple
+
+# Constants used within this module.
+_P = (2 ** 255) - 19 # Order of the field.
+_TWO_TO_255_MINUS_ONE = (2 ** 255) - 1
+
+class fe25519_int:
+    """
+    Class for field elements that are represented as a single native Python
+    integer (always reduced modulo the order of the field). The public
+    interface of this class is identical to that of :obj:`fe25519.fe25519.fe25519`,
+    so instances of this class can be used as the coordinates of the group
+    elements defined in :obj:`ge25519.ge25519`, and every binary representation
+    computed using either class is identical.
+
+    Multiplication, inversion, and exponentiation are delegated to the built-in
+    :obj:`int` operations and :obj:`pow` function, which are much faster than the
+    equivalent operations over five-limb representations in CPython. However,
+    the running time of these operations depends on the operands, so this class
+    must only be used for computations that need not be constant-time.
+
+    >>> two = fe25519_int.one() + fe25519_int.one()
+    >>> (two * two.invert()) == fe25519_int.one()
+    True
+    >>> fe25519_int.from_bytes(two.to_bytes())
+    fe25519_int(2)
+    """
+    __slots__ = ('n',)
+
+    # Precomputed static constants.
+    d = None
+    d2 = None
+    sqrtm1 = None
+    invsqrtamd = None
+    onemsqd = None
+    sqdmone = None
+    sqrtadm1 = None
+    curve25519_A = None
+
+    _int = int # Class of the integers that represent elements.
+
+    @classmethod
+    def zero(cls) -> fe25519_int:
+        """
+        Constant corresponding to the zero element.
+        """
+        return cls(cls._int(0))
+
+    @classmethod
+    def one(cls) -> fe25519_int:
+        """
+        Constant corresponding to the multiplicative identity element.
+        """
+        return cls(cls._int(1))
+
+    def __init__(self: fe25519_int, n: int):
+        """Create field element from an integer in the range ``[0, 2**255 - 19)``."""
+        self.n = n # pylint: disable=invalid-name
+
+    def copy(self: fe25519_int) -> fe25519_int:
+        """
+        Create a copy of this element instance.
+        """
+        return type(self)(self.n)
+
+    def reduce(self: fe25519_int) -> fe25519_int:
+        """
+        Reduce this element to a canonical representation (every instance
+        is already in canonical form).
+        """
+        return type(self)(self.n)
+
+    def __add__(self: fe25519_int, other: fe25519_int) -> fe25519_int:
+        """
+        Compute the sum of this element and another element.
+        """
+        return type(self)((self.n + other.n) % _P)
+
+    def __neg__(self: fe25519_int) -> fe25519_int:
+        """
+        Compute the negation of this element.
+        """
+        return type(self)((-self.n) % _P)
+
+    def cmov(self: fe25519_int, g: fe25519_int, b: int) -> fe25519_int:
+        """Conditionally select this element or another based on a boolean integer."""
+        return type(self)(g.n if b else self.n)
+
+    def cneg(self: fe25519_int, b: int) -> fe25519_int:
+        """
+        Compute the conditional negation of this element.
+        """
+        return type(self)((-self.n) % _P if b else self.n)
+
+    def __abs__(self: fe25519_int) -> fe25519_int:
+        """
+        Compute the absolute value of this element.
+        """
+        return self.cneg(int(self.n & 1))
+
+    def __sub__(self: fe25519_int, other: fe25519_int) -> fe25519_int:
+        """
+        Compute the result of subtracting another element from this element.
+        """
+        return type(self)((self.n - other.n) % _P)
+
+    def __mul__(self: fe25519_int, other: fe25519_int) -> fe25519_int:
+        """
+        Compute the product of this element and another element.
+        """
+        return type(self)((self.n * other.n) % _P)
+
+    def sq(self: fe25519_int) -> fe25519_int: # pylint: disable=invalid-name
+        """
+        Compute the square of this element.
+        """
+        return type(self)((self.n * self.n) % _P)
+
+    def sq2(self: fe25519_int) -> fe25519_int:
+        """
+        Compute twice the square of this element.
+        """
+        return type(self)((2 * self.n * self.n) % _P)
+
+    def pow22523(self: fe25519_int) -> fe25519_int:
+        """
+        Compute this element raised to the power ``(2**255 - 19 - 5) // 8``.
+        """
+        return type(self)(pow(self.n, (_P - 5) // 8, _P))
+
+    def invert(self: fe25519_int) -> fe25519_int:
+        """
+        Compute the multiplicative inverse of this element (the result for
+        the zero element is zero).
+        """
+        return type(self)(pow(self.n, _P - 2, _P))
+
+    def __invert__(self: fe25519_int) -> fe25519_int:
+        """
+        Compute the multiplicative inverse of this element.
+        """
+        return self.invert()
+
+    def __pow__(self: fe25519_int, e: int) -> fe25519_int:
+        """
+        Exponentiation is a synonym for squaring and inversion.
+
+        >>> two = fe25519_int(2)
+        >>> (two ** 2, two ** (-1) == ~two, two ** 3)
+        (fe25519_int(4), True, None)
+        """
+        if e == 2: # Squaring.
+            return self.sq()
+        if e == -1: # Inversion.
+            return self.invert()
+
+        # Supplied exponent is not supported.
+        return None
+
+    def sqrt_ratio_m1_ristretto255(
+            self: fe25519_int,
+            v: fe25519_int
+        ) -> Tuple[fe25519_int, int]:
+        """
+        Compute the result of a specialized root operation.
+        """
+        (u, v) = (self.n, v.n)
+        v3 = (v * v * v) % _P
+        x = (u * v3 * pow((u * v3 * v3 * v) % _P, (_P - 5) // 8, _P)) % _P
+
+        vxx = (v * x * x) % _P
+        has_m_root = int(vxx == u)
+        has_p_root = int(vxx == (-u) % _P)
+        has_f_root = int(vxx == (-u * self.sqrtm1.n) % _P)
+
+        if has_p_root | has_f_root:
+            x = (x * self.sqrtm1.n) % _P
+
+        return (abs(type(self)(x)), has_m_root | has_p_root)
+
+    def chi25519(self: fe25519_int) -> fe25519_int:
+        """
+        Compute the result of a specialized root operation (for elligator).
+        """
+        return type(self)(pow(self.n, (_P - 1) // 2, _P))
+
+    def __eq__(self: fe25519_int, other: fe25519_int) -> bool:
+        """
+        Determine whether this element and another are equivalent.
+        """
+        return self.n == other.n
+
+    def is_zero(self: fe25519_int) -> int:
+        """
+        Determine whether this element is zero.
+        """
+        return int(self.n == 0)
+
+    def is_negative(self: fe25519_int) -> int:
+        """
+        Determine whether the negation bit is set in this element.
+        """
+        return int(self.n & 1)
+
+    @classmethod
+    def from_bytes(cls, bs: bytes) -> fe25519_int:
+        """
+        Assemble an element instance from its byte representation (ignoring
+        the most significant bit, as in :obj:`fe25519.fe25519.fe25519.from_bytes`).
+
+        >>> fe25519_int.from_bytes(bytes([1] + [0] * 30 + [128]))
+        fe25519_int(1)
+        """
+        return cls(cls._int(
+            (int.from_bytes(bs[:32], 'little') & _TWO_TO_255_MINUS_ONE) % _P
+        ))
+
+    def to_bytes(self: fe25519_int) -> bytes:
+        """
+        Build the byte representation of this element.
+        """
+        return int(self.n).to_bytes(32, 'little')
+
+    def __bytes__(self: fe25519_int) -> bytes:
+        """
+        Build the byte representation of this element.
+        """
+        return self.to_bytes()
+
+    def __str__(self: fe25519_int) -> str:
+        """
+        Obtain the string representation of an element.
+        """
+        return type(self).__name__ + '(' + str(int(self.n)) + ')'
+
+    def __repr__(self: fe25519_int) -> str:
+        """
+        Obtain the string representation of an element.
+        """
+        return str(self)
+
+fe25519_int.d = fe25519_int(
+    37095705934669439343138083508754565189542113879843219016388785533085940283555
+)
+fe25519_int.d2 = fe25519_int(
+    16295367250680780974490674513165176452449235426866156013048779062215315747161
+)
+fe25519_int.sqrtm1 = fe25519_int(
+    19681161376707505956807079304988542015446066515923890162744021073123829784752
+)
+fe25519_int.invsqrtamd = fe25519_int(
+    54469307008909316920995813868745141605393597292927456921205312896311721017578
+)
+fe25519_int.onemsqd = fe25519_int(
+    1159843021668779879193775521855586647937357759715417654439879720876111806838
+)
+fe25519_int.sqdmone = fe25519_int(
+    40440834346308536858101042469323190826248399146238708352240133220865137265952
+)
+fe25519_int.sqrtadm1 = fe25519_int(
+    25063068953384623474111414158702152701244531502492656460079210482610430750235
+)
+fe25519_int.curve25519_A = fe25519_int(486662)
@@ -0,0 +1,207 @@
+"""
+Asynchronous interface for applying group operations from :obj:`asyncio`
+coroutines without blocking the event loop. Concurrent requests for the
+same operation are coalesced into batches that are processed by an
+executor.
+"""
+from __future__ import annotations
+from typing import Union, Optional, Tuple, Sequence, Callable, Any
+import asyncio
+import functools
+import concurrent.futures
+
+from ge25519.ge25519 import ge25519, ge25519_p3
+from ge25519.ge25519_pool import _within
+
+def _scalar_mult(chunk: Sequence[Tuple[ge25519_p3, bytes]]) -> Sequence[ge25519_p3]:
+    return [p.scalar_mult(s) for (p, s) in chunk]
+
+def _scalar_mult_base(chunk: Sequence[Tuple[bytes]]) -> Sequence[ge25519_p3]:
+    return [ge25519_p3.scalar_mult_base(s) for (s,) in chunk]
+
+def _from_hash_ristretto255(chunk: Sequence[Tuple[bytes]]) -> Sequence[bytes]:
+    return [ge25519_p3.from_hash_ristretto255(h) for (h,) in chunk]
+
+def _to_bytes(chunk: Sequence[Tuple[ge25519_p3]]) -> Sequence[bytes]:
+    return ge25519_p3.to_bytes_many([p for (p,) in chunk])
+
+def _to_bytes_ristretto255(chunk: Sequence[Tuple[ge25519_p3]]) -> Sequence[bytes]:
+    return ge25519_p3.to_bytes_ristretto255_many([p for (p,) in chunk])
+
+class ge25519_async:
+    """
+    Asynchronous interface to common group operations. Each request is
+    queued, and all requests for the same operation that arrive within a
+    short interval are processed together as a single batch by an executor
+    (so that the event loop is not blocked and batched methods such as
+    :obj:`~ge25519.ge25519.ge25519_p3.to_bytes_many` can be used). Each
+    request is completed with the same result as the corresponding method
+    of :obj:`~ge25519.ge25519.ge25519_p3`.
+
+    :param executor: Executor that processes the batches (by default, the
+        default executor of the event loop). Batches can be processed by a
+        :obj:`concurrent.futures.ProcessPoolExecutor` because all arguments
+        and results can be pickled.
+    :param latency: Largest number of seconds that a request is held before
+        its batch is dispatched (while waiting for other requests).
+    :param size: Largest number of requests in a batch (a batch is dispatched
+        as soon as it reaches this size).
+    :param field: Field element class (or name of a registered class) used for
+        constructed elements (see :obj:`~ge25519.ge25519.ge25519.use_field`).
+
+    If a batch fails, every request in that batch raises the same exception
+    (and if a batch is cancelled, every request in that batch is cancelled).
+
+    >>> async def main():
+    ...     async with ge25519_async(latency=0.01) as facade:
+    ...         ps = await asyncio.gather(*[
+    ...             facade.scalar_mult_base(bytes([i] * 31 + [0])) for i in range(4)
+    ...         ])
+    ...         return await asyncio.gather(*[facade.to_bytes(p) for p in ps])
+    >>> asyncio.run(main()) == [
+    ...     ge25519_p3.scalar_mult_base(bytes([i] * 31 + [0])).to_bytes()
+    ...     for i in range(4)
+    ... ]
+    True
+    """
+    def __init__(
+            self: ge25519_async,
+            executor: Optional[concurrent.futures.Executor] = None,
+            latency: float = 0.001,
+            size: int = 256,
+            field: Union[str, type, None] = None
+        ):
+        if latency < 0:
+            raise ValueError('latency must be a non-negative number')
+        if size < 1:
+            raise ValueError('batch size must be a positive integer')
+
+        self.executor = executor
+        self.latency = latency
+        self.size = size
+        self.field = field
+        self.pending = {} # Requests that have not been dispatched (for each operation).
+        self.timers = {} # Scheduled dispatch of the pending requests (for each operation).
+        self.batches = set() # Batches that have been dispatched but are not complete.
+
+    def _request(
+            self: ge25519_async,
+            function: Callable[[Sequence[tuple]], Sequence[Any]],
+            *arguments: Any
+        ) -> asyncio.Future:
+        # Queue a request and return a future for its result, dispatching
+        # the batch of pending requests if it is full (or scheduling its
+        # dispatch if this is the first request in the batch).
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        requests = self.pending.setdefault(function, [])
+        requests.append((arguments, future))
+
+        if len(requests) >= self.size:
+            self._dispatch(function)
+        elif len(requests) == 1:
+            self.timers[function] = loop.call_later(self.latency, self._dispatch, function)
+
+        return future
+
+    def _dispatch(self: ge25519_async, function: Callable[[Sequence[tuple]], Sequence[Any]]):
+        # Submit all pending requests for an operation as a single batch.
+        timer = self.timers.pop(function, None)
+        if timer is not None:
+            timer.cancel()
+
+        requests = self.pending.pop(function, [])
+        if len(requests) > 0:
+            batch = asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                functools.partial(_within, self.field, function),
+                [arguments for (arguments, _) in requests]
+            )
+            self.batches.add(batch)
+            batch.add_done_callback(functools.partial(self._complete, requests))
+
+    def _complete(
+            self: ge25519_async,
+            requests: Sequence[Tuple[tuple, asyncio.Future]],
+            batch: asyncio.Future
+        ):
+        # Complete every request in a batch with its result (or with the
+        # exception raised while processing the batch, or by cancelling the
+        # request if the batch was cancelled).
+        self.batches.discard(batch)
+        if batch.cancelled():
+            for (_, future) in requests:
+                future.cancel()
+        elif batch.exception() is not None:
+            for (_, future) in requests:
+                if not future.done():
+                    future.set_exception(batch.exception())
+        else:
+            for ((_, future), result) in zip(requests, batch.result()):
+                if not future.done():
+                    future.set_result(result)
+
+    async def scalar_mult(self: ge25519_async, p: ge25519_p3, s: bytes) -> ge25519_p3:
+        """
+        Multiply an element by a scalar (as in
+        :obj:`~ge25519.ge25519.ge25519_p3.scalar_mult`).
+        """
+        return await self._request(_scalar_mult, p, s)
+
+    async def scalar_mult_base(self: ge25519_async, s: bytes) -> ge25519_p3:
+        """
+        Multiply the base point by a scalar (as in
+        :obj:`~ge25519.ge25519.ge25519_p3.scalar_mult_base`).
+        """
+        return await self._request(_scalar_mult_base, s)
+
+    async def from_hash_ristretto255(self: ge25519_async, h: bytes) -> bytes:
+        """
+        Construct a Ristretto point from a 64-byte hash value (as in
+        :obj:`~ge25519.ge25519.ge25519_p3.from_hash_ristretto255`).
+        """
+        return await self._request(_from_hash_ristretto255, h)
+
+    async def to_bytes(self: ge25519_async, p: ge25519_p3) -> bytes:
+        """
+        Emit the binary representation of an element (a batch of these
+        requests shares a single field inversion, as in
+        :obj:`~ge25519.ge25519.ge25519_p3.to_bytes_many`).
+        """
+        return await self._request(_to_bytes, p)
+
+    async def to_bytes_ristretto255(self: ge25519_async, p: ge25519_p3) -> bytes:
+        """
+        Emit the binary representation of the Ristretto point that an element
+        represents (as in
+        :obj:`~ge25519.ge25519.ge25519_p3.to_bytes_ristretto255_many`).
+        """
+        return await self._request(_to_bytes_ristretto255, p)
+
+    async def flush(self: ge25519_async):
+        """
+        Dispatch all pending requests immediately and wait until every batch
+        that has been dispatched is complete.
+        """
+        for function in list(self.pending):
+            self._dispatch(function)
+        if len(self.batches) > 0:
+            await asyncio.wait(list(self.batches))
+
+    async def close(self: ge25519_async):
+        """
+        Complete all pending requests (the executor is not shut down, as it
+        may be shared).
+        """
+        await self.flush()
+
+    async def __aenter__(self: ge25519_async) -> ge25519_async:
+        return self
+
+    async def __aexit__(self: ge25519_async, *exc_info):
+        await self.close()
+
+# Declare the entry points that report to registered hooks.
+ge25519._entry_point(ge25519_async, [ # pylint: disable=protected-access
+    'scalar_mult', 'scalar_mult_base', 'from_hash_ristretto255', 'to_bytes', 'to_bytes_ristretto255'
+])
@@ -0,0 +1,673 @@
+"""
+Data structures for working with batches of Ed25519 group elements that
+are represented as `NumPy <https://numpy.org>`__ arrays (this module can
+only be imported if that optional library is installed).
+"""
+# pylint: disable=missing-function-docstring
+from __future__ import annotations
+from typing import Union, Tuple, Sequence, Callable
+import numpy as np
+from fe25519 import fe25519
+
+from ge25519.ge25519 import \
+    ge25519, ge25519_p3, ge25519_p1p1, ge25519_precomp, ge25519_cached, \
+    _lock, _length
+
+# Constants used within this module.
+_P = (2 ** 255) - 19 # Order of the field.
+_CHUNK = 4096 # Largest number of elements processed using one set of arrays.
+
+# Field elements in a batch are represented using ten signed limbs in radix
+# ``2**25.5`` (alternating between 26 and 25 bits, as in the reference
+# implementation of Ed25519). A batch of ``N`` elements is stored as an
+# array of shape ``(10, N)`` so that each limb is a contiguous vector.
+_WIDTHS = (26, 25, 26, 25, 26, 25, 26, 25, 26, 25)
+_OFFSETS = tuple(sum(_WIDTHS[:i]) for i in range(10))
+_SHIFT = np.array(_WIDTHS, dtype=np.int64).reshape(10, 1)
+_MASK = (np.int64(1) << _SHIFT) - 1
+_WRAP = np.array([19] + [1] * 9, dtype=np.int64).reshape(10, 1) # 2**255 == 19.
+_ODD = np.array([1, 2] * 5, dtype=np.int64).reshape(10, 1)
+
+def _fe_carry(h: np.ndarray) -> np.ndarray:
+    """
+    Carry the excess of every limb into the next limb in parallel. After
+    a single pass, every limb of a sum or difference of two elements (and,
+    after two passes, of a product) has magnitude below ``2**26.01``, so
+    that no intermediate result of a multiplication exceeds ``2**61``.
+    """
+    c = h >> _SHIFT
+    return (h & _MASK) + np.roll(c, 1, axis=0) * _WRAP
+
+def _fe_add(f: np.ndarray, g: np.ndarray) -> np.ndarray:
+    return _fe_carry(f + g)
+
+def _fe_sub(f: np.ndarray, g: np.ndarray) -> np.ndarray:
+    return _fe_carry(f - g)
+
+def _fe_mul(f: np.ndarray, g: np.ndarray) -> np.ndarray:
+    """
+    Multiply elements. The product of limbs ``i`` and ``k`` contributes to
+    limb ``(i + k) % 10`` of the result, scaled by 19 if it wraps around and
+    by 2 if both limbs are odd. Thus, the scaled limbs of ``g`` that multiply
+    limb ``i`` of ``f`` form a contiguous slice of ``19*g`` followed by ``g``
+    (with the odd limbs of ``g`` doubled if ``i`` is odd).
+    """
+    g2 = g * _ODD
+    ext = (np.concatenate([g * 19, g]), np.concatenate([g2 * 19, g2]))
+    h = f[0] * g
+    for i in range(1, 10):
+        h += f[i] * ext[i % 2][10 - i: 20 - i]
+    return _fe_carry(_fe_carry(h))
+
+def _fe_sq(f: np.ndarray) -> np.ndarray:
+    return _fe_mul(f, f)
+
+def _fe_sq2(f: np.ndarray) -> np.ndarray:
+    return _fe_carry(_fe_mul(f, f) * 2)
+
+def _fe_sqn(f: np.ndarray, n: int) -> np.ndarray:
+    for _ in range(n):
+        f = _fe_mul(f, f)
+    return f
+
+def _fe_neg(f: np.ndarray) -> np.ndarray:
+    return _fe_carry(-f)
+
+def _fe_pow22523(z: np.ndarray) -> np.ndarray:
+    """
+    Raise elements to the power ``2**252 - 3`` (*i.e.*, ``(2**255 - 19 - 5) // 8``)
+    using the same addition chain as :obj:`fe25519.fe25519.fe25519.pow22523`.
+    """
+    t0 = _fe_sq(z)
+    t1 = _fe_mul(z, _fe_sqn(t0, 2)) # 9
+    t0 = _fe_mul(t0, t1) # 11
+    t0 = _fe_mul(t1, _fe_sq(t0)) # 2^5 - 1
+    t0 = _fe_mul(_fe_sqn(t0, 5), t0) # 2^10 - 1
+    t1 = _fe_mul(_fe_sqn(t0, 10), t0) # 2^20 - 1
+    t1 = _fe_mul(_fe_sqn(t1, 20), t1) # 2^40 - 1
+    t0 = _fe_mul(_fe_sqn(t1, 10), t0) # 2^50 - 1
+    t1 = _fe_mul(_fe_sqn(t0, 50), t0) # 2^100 - 1
+    t1 = _fe_mul(_fe_sqn(t1, 100), t1) # 2^200 - 1
+    t0 = _fe_mul(_fe_sqn(t1, 50), t0) # 2^250 - 1
+    return _fe_mul(_fe_sqn(t0, 2), z) # 2^252 - 3
+
+def _fe_from_bytes(bs: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of shape ``(N, 32)`` containing the byte representations
+    of field elements into limbs (ignoring the most significant bit).
+    """
+    w = np.ascontiguousarray(bs, dtype=np.uint8).view('<u8').reshape(-1, 4).T
+    h = np.empty((10, w.shape[1]), dtype=np.int64)
+    for (i, (offset, width)) in enumerate(zip(_OFFSETS, _WIDTHS)):
+        (k, s) = divmod(offset, 64)
+        limb = w[k] >> np.uint64(s)
+        if s + width > 64:
+            limb = limb | (w[k + 1] << np.uint64(64 - s))
+        h[i] = (limb & np.uint64((1 << width) - 1)).astype(np.int64)
+    return h
+
+def _fe_canonical(h: np.ndarray) -> np.ndarray:
+    """
+    Fully reduce elements so that every limb is within its range and the
+    value of each element is below ``2**255 - 19``.
+    """
+    h = h.copy()
+    for _ in range(3): # Sequential carries until every limb is in range.
+        for i in range(10):
+            c = h[i] >> _WIDTHS[i]
+            h[i] &= (1 << _WIDTHS[i]) - 1
+            if i < 9:
+                h[i + 1] += c
+            else:
+                h[0] += 19 * c
+
+    # Subtract the modulus if the value is at least ``2**255 - 19``.
+    q = (h[0] + 19) >> 26
+    for i in range(1, 10):
+        q = (h[i] + q) >> _WIDTHS[i]
+    h[0] += 19 * q
+    for i in range(9):
+        h[i + 1] += h[i] >> _WIDTHS[i]
+        h[i] &= (1 << _WIDTHS[i]) - 1
+    h[9] &= (1 << 25) - 1
+
+    return h
+
+def _fe_to_bytes(h: np.ndarray) -> np.ndarray:
+    """
+    Convert limbs into an array of shape ``(N, 32)`` containing the canonical
+    byte representations of the field elements.
+    """
+    h = _fe_canonical(h)
+    w = np.zeros((4, h.shape[1]), dtype=np.uint64)
+    for (i, (offset, width)) in enumerate(zip(_OFFSETS, _WIDTHS)):
+        (k, s) = divmod(offset, 64)
+        limb = h[i].astype(np.uint64)
+        w[k] |= limb << np.uint64(s)
+        if s + width > 64:
+            w[k + 1] |= limb >> np.uint64(64 - s)
+    return np.ascontiguousarray(w.T).astype('<u8').view(np.uint8).reshape(-1, 32)
+
+def _fe_is_zero(h: np.ndarray) -> np.ndarray:
+    return ~_fe_canonical(h).any(axis=0)
+
+def _fe_is_negative(h: np.ndarray) -> np.ndarray:
+    return (_fe_canonical(h)[0] & 1).astype(bool)
+
+def _fe_abs(h: np.ndarray) -> np.ndarray:
+    return np.where(_fe_is_negative(h), _fe_neg(h), h)
+
+def _fe_pad(x: np.ndarray) -> np.ndarray:
+    # Append the multiplicative identity to a batch of odd length.
+    return np.concatenate([x, _ONE], axis=1) if x.shape[1] % 2 == 1 else x
+
+def _fe_invert(z: np.ndarray) -> np.ndarray:
+    """
+    Invert every element in a batch using a product tree, so that only one
+    inversion of an individual element is required (at the cost of about
+    three multiplications per element). As with an individual inversion,
+    the result for a zero element is zero.
+    """
+    if z.shape[1] == 0:
+        return z.copy()
+
+    zeros = _fe_is_zero(z)
+    levels = [np.where(zeros, _ONE, z)]
+    while levels[-1].shape[1] > 1:
+        x = _fe_pad(levels[-1])
+        levels.append(_fe_mul(x[:, 0::2], x[:, 1::2]))
+
+    # Invert the product of all elements using the built-in integer type.
+    root = int.from_bytes(_fe_to_bytes(levels[-1]).tobytes(), 'little')
+    inv = _fe_constant(pow(root, _P - 2, _P).to_bytes(32, 'little'))
+
+    # The inverse of each element is the product of the inverse of its
+    # parent and its sibling.
+    for x in reversed(levels[:-1]):
+        y = _fe_pad(x)
+        children = np.empty(y.shape, dtype=np.int64)
+        children[:, 0::2] = _fe_mul(inv, y[:, 1::2])
+        children[:, 1::2] = _fe_mul(inv, y[:, 0::2])
+        inv = children[:, :x.shape[1]]
+
+    return np.where(zeros, 0, inv)
+
+def _fe_constant(bs: bytes) -> np.ndarray:
+    # Limbs of a single field element (that can be broadcast across a batch).
+    return _fe_from_bytes(np.frombuffer(bs, dtype=np.uint8).reshape(1, 32))
+
+_ONE = _fe_constant(fe25519.one().to_bytes())
+_D = _fe_constant(fe25519.d.to_bytes())
+_D2 = _fe_constant(fe25519.d2.to_bytes())
+_SQRTM1 = _fe_constant(fe25519.sqrtm1.to_bytes())
+_INVSQRTAMD = _fe_constant(fe25519.invsqrtamd.to_bytes())
+
+def _fe_sqrt_ratio_m1(u: np.ndarray, v: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of :obj:`fe25519.fe25519.fe25519.sqrt_ratio_m1_ristretto255`
+    (the second component of the result is a boolean array).
+    """
+    v3 = _fe_mul(_fe_sq(v), v)
+    x = _fe_mul(_fe_mul(u, v3), _fe_pow22523(_fe_mul(u, _fe_mul(_fe_sq(v3), v))))
+
+    vxx = _fe_mul(v, _fe_sq(x))
+    has_m_root = _fe_is_zero(_fe_sub(vxx, u))
+    has_p_root = _fe_is_zero(_fe_add(vxx, u))
+    has_f_root = _fe_is_zero(_fe_add(vxx, _fe_mul(u, _SQRTM1)))
+    x = np.where(has_p_root | has_f_root, _fe_mul(x, _SQRTM1), x)
+
+    return (_fe_abs(x), has_m_root | has_p_root)
+
+def _scalars(a: np.ndarray) -> np.ndarray:
+    # Array of shape ``(N, 32)`` and dtype ``uint8`` containing 32-byte values
+    # (other dtypes are rejected rather than converted, as conversion would
+    # silently wrap any values outside the range of a byte).
+    a = np.asarray(a)
+    if a.dtype != np.uint8:
+        raise ValueError('input must be an array of dtype uint8')
+    if a.ndim != 2 or a.shape[1] != 32:
+        raise ValueError('input must be an array of shape (N, 32)')
+    return a
+
+def _chunked(
+        function: Callable[[np.ndarray], Tuple[ge25519_p3_batch, np.ndarray]],
+        bs: np.ndarray
+    ) -> Tuple[ge25519_p3_batch, np.ndarray]:
+    # Apply a decoding function to consecutive chunks of an array of shape
+    # ``(N, 32)`` and assemble the results.
+    results = [function(bs[i: i + _CHUNK]) for i in range(0, len(bs), _CHUNK)]
+    return (
+        ge25519_p3_batch.concatenate([batch for (batch, _) in results]),
+        np.concatenate([mask for (_, mask) in results])
+    )
+
+def _radix16(a: np.ndarray) -> np.ndarray:
+    """
+    Signed radix-16 digits of every scalar in an array of shape ``(N, 32)``
+    (each scalar is expected to satisfy ``a[31] <= 127``), as an array of
+    shape ``(64, N)`` in which every digit is between -8 and 8.
+    """
+    a = a.T.astype(np.int64)
+    e = np.empty((64, a.shape[1]), dtype=np.int64)
+    e[0::2] = a & 15
+    e[1::2] = a >> 4
+
+    carry = np.zeros(a.shape[1], dtype=np.int64)
+    for i in range(63):
+        e[i] += carry
+        carry = (e[i] + 8) >> 4
+        e[i] -= carry << 4
+    e[63] += carry
+
+    return e
+
+class ge25519_batch:
+    """
+    Base class for batches of group elements. Each coordinate of a batch
+    of ``N`` elements is an array of shape ``(10, N)`` that holds the limbs
+    of the ``N`` field elements, so every field operation on the coordinates
+    of all elements is performed using a small number of array operations
+    (amortizing the overhead of the interpreter across the batch).
+    """
+    __slots__ = ()
+    _element = None # Class of the individual elements in a batch.
+
+    @classmethod
+    def from_points(cls, points: Sequence[ge25519]) -> ge25519_batch:
+        """
+        Assemble a batch from a sequence of individual elements.
+        """
+        return cls(*[
+            _fe_from_bytes(np.frombuffer(
+                b''.join(getattr(p, name).to_bytes() for p in points),
+                dtype=np.uint8
+            ).reshape(-1, 32))
+            for name in cls.__slots__
+        ])
+
+    def to_points(
+            self: ge25519_batch,
+            field: Union[str, type] = None
+        ) -> Sequence[ge25519]:
+        """
+        Convert this batch into a list of individual elements (see
+        :obj:`~ge25519.ge25519.ge25519.use_field` regarding the optional field
+        element class).
+        """
+        field = ge25519._resolve(field) # pylint: disable=protected-access
+        columns = [
+            _fe_to_bytes(getattr(self, name)).tobytes()
+            for name in type(self).__slots__
+        ]
+        return [
+            type(self)._element(*[ # pylint: disable=not-callable
+                field.from_bytes(column[i: i + 32]) for column in columns
+            ])
+            for i in range(0, len(self) * 32, 32)
+        ]
+
+    @classmethod
+    def concatenate(cls, batches: Sequence[ge25519_batch]) -> ge25519_batch:
+        """
+        Assemble a batch from a sequence of batches.
+        """
+        return cls(*[
+            np.concatenate([getattr(b, name) for b in batches], axis=1)
+            for name in cls.__slots__
+        ])
+
+    def __getitem__(self: ge25519_batch, key: slice) -> ge25519_batch:
+        """
+        Batch that consists of a slice of the elements in this batch.
+        """
+        return type(self)(*[getattr(self, name)[:, key] for name in type(self).__slots__])
+
+    def __len__(self: ge25519_batch) -> int:
+        """
+        Number of elements in this batch.
+        """
+        return getattr(self, type(self).__slots__[0]).shape[1]
+
+class ge25519_p3_batch(ge25519_batch):
+    """
+    Batch of group elements corresponding to :obj:`~ge25519.ge25519.ge25519_p3`.
+
+    >>> from ge25519.ge25519 import ge25519_p3
+    >>> ps = [ge25519_p3.from_uniform(bytes([i] * 32)) for i in range(3)]
+    >>> b = ge25519_p3_batch.from_points(ps)
+    >>> len(b)
+    3
+    >>> qs = ge25519_p3_batch.from_p1p1(b.dbl()).to_points()
+    >>> [q.to_bytes() for q in qs] == [
+    ...     ge25519_p3.from_p1p1(p.dbl()).to_bytes() for p in ps
+    ... ]
+    True
+    """
+    __slots__ = ('X', 'Y', 'Z', 'T')
+    _element = ge25519_p3
+
+    def __init__(
+            self: ge25519_p3_batch,
+            X: np.ndarray,
+            Y: np.ndarray,
+            Z: np.ndarray,
+            T: np.ndarray
+        ):
+        self.X = X
+        self.Y = Y
+        self.Z = Z
+        self.T = T
+
+    @staticmethod
+    def zero(count: int) -> ge25519_p3_batch:
+        """
+        Batch in which every element is the zero element.
+        """
+        (zero, one) = (np.zeros((10, count), dtype=np.int64), np.repeat(_ONE, count, axis=1))
+        return ge25519_p3_batch(zero, one, one.copy(), zero.copy())
+
+    @staticmethod
+    def from_bytes(bs: np.ndarray) -> Tuple[ge25519_p3_batch, np.ndarray]:
+        """
+        Construct a batch of elements from an array of shape ``(N, 32)`` (and
+        dtype ``uint8``) that contains their binary representations. The second
+        component of the result is a boolean array that indicates which
+        representations were accepted (corresponding to a ``root_check`` value
+        of zero in the result of :obj:`~ge25519.ge25519.ge25519_p3.from_bytes`);
+        the entries of the batch for rejected representations are unspecified.
+
+        >>> import numpy as np
+        >>> bs = np.array([[0] * 32, [1] + [0] * 31, [2] + [0] * 31], dtype=np.uint8)
+        >>> (batch, mask) = ge25519_p3_batch.from_bytes(bs)
+        >>> mask.tolist()
+        [True, True, False]
+        >>> bool((batch.to_bytes()[mask] == bs[mask]).all())
+        True
+        """
+        bs = _scalars(bs)
+        if len(bs) > _CHUNK:
+            return _chunked(ge25519_p3_batch.from_bytes, bs)
+
+        Y = _fe_from_bytes(bs)
+        Z = np.repeat(_ONE, len(bs), axis=1)
+        u = _fe_sq(Y)
+        v = _fe_add(_fe_mul(u, _D), Z) # v = dy^2+1
+        u = _fe_sub(u, Z) # u = y^2-1
+
+        v3 = _fe_mul(_fe_sq(v), v) # v3 = v^3
+        X = _fe_mul(_fe_mul(_fe_sq(v3), v), u) # x = uv^7
+        X = _fe_mul(_fe_mul(_fe_pow22523(X), v3), u) # x = uv^3(uv^7)^((q-5)/8)
+
+        vxx = _fe_mul(_fe_sq(X), v)
+        has_m_root = _fe_is_zero(_fe_sub(vxx, u))
+        has_p_root = _fe_is_zero(_fe_add(vxx, u))
+        X = np.where(has_m_root, X, _fe_mul(X, _SQRTM1))
+
+        X = np.where(_fe_is_negative(X) ^ (bs[:, 31] >= 128), _fe_neg(X), X)
+        return (ge25519_p3_batch(X, Y, Z, _fe_mul(X, Y)), has_m_root | has_p_root)
+
+    @staticmethod
+    def from_bytes_ristretto255(bs: np.ndarray) -> Tuple[ge25519_p3_batch, np.ndarray]:
+        """
+        Construct a batch of elements from an array of shape ``(N, 32)`` (and
+        dtype ``uint8``) that contains the binary representations of Ristretto
+        points. The second component of the result is a boolean array that
+        indicates which representations were accepted (*i.e.*, for which
+        :obj:`~ge25519.ge25519.ge25519_p3.from_bytes_ristretto255` does not
+        return ``None``); the entries of the batch for rejected representations
+        are unspecified.
+        """
+        bs = _scalars(bs)
+        if len(bs) > _CHUNK:
+            return _chunked(ge25519_p3_batch.from_bytes_ristretto255, bs)
+
+        s_ = _fe_from_bytes(bs)
+        ss = _fe_sq(s_)
+        u1 = _fe_sub(_ONE, ss) # u1 = 1-ss
+        u1u1 = _fe_sq(u1)
+        u2 = _fe_add(_ONE, ss) # u2 = 1+ss
+        u2u2 = _fe_sq(u2)
+        v = _fe_sub(_fe_neg(_fe_mul(_D, u1u1)), u2u2) # v = -(d*u1^2)-u2^2
+
+        (inv_sqrt, was_square) = _fe_sqrt_ratio_m1(_ONE, _fe_mul(v, u2u2))
+        X = _fe_mul(inv_sqrt, u2)
+        Y = _fe_mul(_fe_mul(inv_sqrt, X), v)
+        X = _fe_mul(X, s_)
+        X = _fe_abs(_fe_add(X, X))
+        Y = _fe_mul(u1, Y)
+        T = _fe_mul(X, Y)
+
+        valid = was_square & ~_fe_is_negative(T) & ~_fe_is_zero(Y)
+        return (ge25519_p3_batch(X, Y, np.repeat(_ONE, len(bs), axis=1), T), valid)
+
+    @staticmethod
+    def from_p1p1(p: ge25519_p1p1_batch) -> ge25519_p3_batch:
+        return ge25519_p3_batch(
+            _fe_mul(p.X, p.T), _fe_mul(p.Y, p.Z), _fe_mul(p.Z, p.T), _fe_mul(p.X, p.Y)
+        )
+
+    def dbl(self: ge25519_p3_batch) -> ge25519_p1p1_batch:
+        return ge25519_p1p1_batch.dbl(self)
+
+    @staticmethod
+    def scalar_mult_base(a: np.ndarray) -> ge25519_p3_batch:
+        """
+        Multiply the base point by every scalar in an array of shape
+        ``(N, 32)`` and dtype ``uint8`` (where each scalar is expected to satisfy ``a[31] <= 127``).
+        The results are identical to those of
+        :obj:`~ge25519.ge25519.ge25519_p3.scalar_mult_base`. As in that method,
+        the scalars are recoded into signed radix-16 digits, and the entries
+        of the table of precomputed multiples are selected without indexing
+        by the digits (so the sequence of operations and memory accesses does
+        not depend on the scalars).
+
+        >>> import numpy as np
+        >>> from ge25519.ge25519 import ge25519_p3
+        >>> a = np.array([[i] * 31 + [0] for i in range(4)], dtype=np.uint8)
+        >>> bs = ge25519_p3_batch.scalar_mult_base(a).to_bytes()
+        >>> bs.shape
+        (4, 32)
+        >>> [bytes(b) for b in bs] == [
+        ...     ge25519_p3.scalar_mult_base(bytes(s)).to_bytes() for s in a
+        ... ]
+        True
+        """
+        a = _scalars(a)
+        if len(a) > _CHUNK: # Limit the size of intermediate arrays.
+            return ge25519_p3_batch.concatenate([
+                ge25519_p3_batch.scalar_mult_base(a[i: i + _CHUNK])
+                for i in range(0, len(a), _CHUNK)
+            ])
+
+        e = _radix16(a)
+        h = ge25519_p3_batch.zero(e.shape[1])
+        for m in (1, 0):
+            if m == 0:
+                for _ in range(4):
+                    h = ge25519_p3_batch.from_p1p1(h.dbl()) # *16
+
+            for k in range(32):
+                t = ge25519_precomp_batch._select_base(k, e[2 * k + m]) # pylint: disable=protected-access
+                h = ge25519_p3_batch.from_p1p1(ge25519_p1p1_batch.madd(h, t))
+
+        return h
+
+    def to_bytes(self: ge25519_p3_batch) -> np.ndarray:
+        """
+        Emit binary representations of the elements in this batch as an
+        array of shape ``(N, 32)`` (sharing a single field inversion across
+        all of the elements).
+        """
+        recip = _fe_invert(self.Z)
+        x = _fe_canonical(_fe_mul(self.X, recip))
+        bs = _fe_to_bytes(_fe_mul(self.Y, recip))
+        bs[:, 31] ^= (x[0] & 1).astype(np.uint8) << 7
+        return bs
+
+    def to_bytes_ristretto255(self: ge25519_p3_batch) -> np.ndarray:
+        """
+        Emit binary representations of the Ristretto points that the elements
+        in this batch represent as an array of shape ``(N, 32)``.
+        """
+        if len(self) > _CHUNK:
+            return np.concatenate([
+                self[i: i + _CHUNK].to_bytes_ristretto255() # pylint: disable=no-member
+                for i in range(0, len(self), _CHUNK)
+            ])
+
+        (X, Y, Z, T) = (self.X, self.Y, self.Z, self.T)
+        u1 = _fe_mul(_fe_add(Z, Y), _fe_sub(Z, Y)) # u1 = (Z+Y)*(Z-Y)
+        u2 = _fe_mul(X, Y) # u2 = X*Y
+
+        (inv_sqrt, _) = _fe_sqrt_ratio_m1(_ONE, _fe_mul(u1, _fe_sq(u2)))
+        den1 = _fe_mul(inv_sqrt, u1)
+        den2 = _fe_mul(inv_sqrt, u2)
+        z_inv = _fe_mul(_fe_mul(den1, den2), T)
+
+        rotate = _fe_is_negative(_fe_mul(T, z_inv))
+        x_ = np.where(rotate, _fe_mul(Y, _SQRTM1), X)
+        y_ = np.where(rotate, _fe_mul(X, _SQRTM1), Y)
+        den_inv = np.where(rotate, _fe_mul(den1, _INVSQRTAMD), den2)
+
+        y_ = np.where(_fe_is_negative(_fe_mul(x_, z_inv)), _fe_neg(y_), y_)
+        return _fe_to_bytes(_fe_abs(_fe_mul(den_inv, _fe_sub(Z, y_))))
+
+class ge25519_p1p1_batch(ge25519_batch):
+    """
+    Batch of group elements corresponding to :obj:`~ge25519.ge25519.ge25519_p1p1`.
+    """
+    __slots__ = ('X', 'Y', 'Z', 'T')
+    _element = ge25519_p1p1
+
+    def __init__(
+            self: ge25519_p1p1_batch,
+            X: np.ndarray,
+            Y: np.ndarray,
+            Z: np.ndarray,
+            T: np.ndarray
+        ):
+        self.X = X
+        self.Y = Y
+        self.Z = Z
+        self.T = T
+
+    @staticmethod
+    def dbl(p: ge25519_p3_batch) -> ge25519_p1p1_batch:
+        (x2, y2) = (_fe_sq(p.X), _fe_sq(p.Y))
+        t0 = _fe_sq(_fe_add(p.X, p.Y))
+        Y = _fe_add(y2, x2)
+        Z = _fe_sub(y2, x2)
+        return ge25519_p1p1_batch(_fe_sub(t0, Y), Y, Z, _fe_sub(_fe_sq2(p.Z), Z))
+
+    @staticmethod
+    def madd(p: ge25519_p3_batch, q: ge25519_precomp_batch) -> ge25519_p1p1_batch:
+        """
+        Method that supports scalar multiplication of a base element.
+        """
+        Z = _fe_mul(_fe_add(p.Y, p.X), q.yplusx)
+        Y = _fe_mul(_fe_sub(p.Y, p.X), q.yminusx)
+        T = _fe_mul(q.xy2d, p.T)
+        t0 = _fe_add(p.Z, p.Z)
+        return ge25519_p1p1_batch(_fe_sub(Z, Y), _fe_add(Z, Y), _fe_add(t0, T), _fe_sub(t0, T))
+
+    @staticmethod
+    def add(p: ge25519_p3_batch, q: ge25519_cached_batch) -> ge25519_p1p1_batch:
+        """
+        Method that supports the implementation of an addition
+        operation for elliptic curve points.
+        """
+        Z = _fe_mul(_fe_add(p.Y, p.X), q.YplusX)
+        Y = _fe_mul(_fe_sub(p.Y, p.X), q.YminusX)
+        T = _fe_mul(q.T2d, p.T)
+        X = _fe_mul(p.Z, q.Z)
+        t0 = _fe_add(X, X)
+        return ge25519_p1p1_batch(_fe_sub(Z, Y), _fe_add(Z, Y), _fe_add(t0, T), _fe_sub(t0, T))
+
+class ge25519_precomp_batch(ge25519_batch):
+    """
+    Batch of group elements corresponding to :obj:`~ge25519.ge25519.ge25519_precomp`.
+    """
+    __slots__ = ('yplusx', 'yminusx', 'xy2d')
+    _element = ge25519_precomp
+    _base = None # Limbs of the precomputed table (converted when it is first used).
+
+    @staticmethod
+    def _base_table() -> np.ndarray:
+        # Table of shape ``(32, 30, 9)`` in which column ``j`` of row ``k``
+        # holds the limbs of the coordinates of the entry ``j*256^k*B`` (so
+        # that column zero holds the zero element).
+        # pylint: disable=protected-access,not-an-iterable,too-many-function-args
+        if ge25519_precomp_batch._base is None:
+            with _lock:
+                if ge25519_precomp_batch._base is None:
+                    rows = [
+                        [ge25519_precomp.zero(fe25519)] + list(row)
+                        for row in ge25519_precomp._base
+                    ]
+                    batch = ge25519_precomp_batch.from_points([q for row in rows for q in row])
+                    limbs = np.concatenate([batch.yplusx, batch.yminusx, batch.xy2d])
+                    table = np.ascontiguousarray(limbs.reshape(30, 32, 9).transpose(1, 0, 2))
+                    table.setflags(write=False) # Shared by all threads.
+                    ge25519_precomp_batch._base = table
+
+        return ge25519_precomp_batch._base
+
+    @staticmethod
+    def _select_base(pos: int, b: np.ndarray) -> ge25519_precomp_batch:
+        """
+        Select the entry ``b*256^pos*B`` of the precomputed table for every
+        digit in an array of digits between -8 and 8. Each entry is selected
+        by multiplying the table row by a one-hot matrix (rather than by
+        indexing the table using the digits), and each entry for a negative
+        digit is negated using masks.
+        """
+        bnegative = b < 0
+        babs = np.abs(b)
+        onehot = (babs == np.arange(9).reshape(9, 1)).astype(np.int64)
+        table = ge25519_precomp_batch._base_table()[pos] # pylint: disable=unsubscriptable-object
+        t = (table @ onehot).reshape(3, 10, -1)
+        return ge25519_precomp_batch(
+            np.where(bnegative, t[1], t[0]),
+            np.where(bnegative, t[0], t[1]),
+            np.where(bnegative, -t[2], t[2])
+        )
+
+    def __init__(
+            self: ge25519_precomp_batch,
+            yplusx: np.ndarray,
+            yminusx: np.ndarray,
+            xy2d: np.ndarray
+        ):
+        self.yplusx = yplusx
+        self.yminusx = yminusx
+        self.xy2d = xy2d
+
+class ge25519_cached_batch(ge25519_batch):
+    """
+    Batch of group elements corresponding to :obj:`~ge25519.ge25519.ge25519_cached`.
+    """
+    __slots__ = ('YplusX', 'YminusX', 'Z', 'T2d')
+    _element = ge25519_cached
+
+    def __init__(
+            self: ge25519_cached_batch,
+            YplusX: np.ndarray,
+            YminusX: np.ndarray,
+            Z: np.ndarray,
+            T2d: np.ndarray
+        ):
+        self.YplusX = YplusX
+        self.YminusX = YminusX
+        self.Z = Z
+        self.T2d = T2d
+
+    @staticmethod
+    def from_p3(p: ge25519_p3_batch) -> ge25519_cached_batch:
+        return ge25519_cached_batch(
+            _fe_add(p.Y, p.X), _fe_sub(p.Y, p.X), p.Z.copy(), _fe_mul(p.T, _D2)
+        )
+
+# Declare the entry points that report to registered hooks.
+ge25519._entry_point(ge25519_p3_batch, [ # pylint: disable=protected-access
+    'from_bytes', 'from_bytes_ristretto255', 'scalar_mult_base', 'to_bytes', 'to_bytes_ristretto255'
+], _length)
@@ -0,0 +1,268 @@
+"""
+Pool of worker processes (or, in free-threaded builds of CPython, worker
+threads) for applying heavy group operations to large batches of binary
+representations of group elements and scalars.
+"""
+from __future__ import annotations
+from typing import Union, Optional, Tuple, Sequence, Iterable, Iterator, Callable
+import sys
+import os
+import functools
+import collections
+import itertools
+import concurrent.futures
+
+from ge25519.ge25519 import ge25519, ge25519_p3
+
+def _initialize(field: Union[str, type, None], threads: bool = False):
+    """
+    Select the field element class in a worker process (but not in a worker
+    thread, as that would affect the entire process) and load the precomputed
+    tables of the base point (so that they are ready for the first chunk).
+    """
+    if field is not None and not threads:
+        ge25519.use_field(field)
+    with ge25519._unreported(), ge25519.using_field(field): # pylint: disable=protected-access
+        ge25519_p3.scalar_mult_base(bytes(32))
+        ge25519_p3.double_scalar_mult_vartime(bytes(32), ge25519_p3.zero(), bytes(32))
+
+def _free_threaded() -> bool:
+    """
+    Determine whether the running interpreter is a free-threaded build of
+    CPython in which the global interpreter lock is disabled.
+    """
+    return not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+def _within(
+        field: Union[str, type, None],
+        function: Callable[[Sequence[tuple]], Sequence[bytes]],
+        chunk: Sequence[tuple]
+    ) -> Sequence[bytes]:
+    """
+    Apply a worker function to a chunk in a worker thread or process using
+    the specified field element class (without changing the process-wide
+    default class). The entry points invoked by the worker function are not
+    reported to hooks, as the entry point that dispatched the chunk is
+    reported by its caller.
+    """
+    with ge25519._unreported(), ge25519.using_field(field): # pylint: disable=protected-access
+        return function(chunk)
+
+def _results(arguments: tuple, result: Sequence[bytes]) -> int: # pylint: disable=unused-argument
+    """
+    Number of inputs in a batch (which may have been supplied as an iterator).
+    """
+    return len(result)
+
+def _scalar_mult(chunk: Sequence[Tuple[bytes, bytes]]) -> Sequence[bytes]:
+    return [ge25519_p3.from_bytes(p).scalar_mult(s).to_bytes() for (s, p) in chunk]
+
+def _scalar_mult_ristretto255(chunk: Sequence[Tuple[bytes, bytes]]) -> Sequence[bytes]:
+    return [
+        None if p is None else p.scalar_mult(s).to_bytes_ristretto255()
+        for (s, p) in (
+            (s, ge25519_p3.from_bytes_ristretto255(p)) for (s, p) in chunk
+        )
+    ]
+
+def _scalar_mult_base(chunk: Sequence[Tuple[bytes]]) -> Sequence[bytes]:
+    return ge25519_p3.to_bytes_many([ge25519_p3.scalar_mult_base(s) for (s,) in chunk])
+
+def _from_hash_ristretto255(chunk: Sequence[Tuple[bytes]]) -> Sequence[bytes]:
+    return [ge25519_p3.from_hash_ristretto255(h) for (h,) in chunk]
+
+# Worker function for each operation.
+_OPERATIONS = {
+    'scalar_mult': _scalar_mult,
+    'scalar_mult_ristretto255': _scalar_mult_ristretto255,
+    'scalar_mult_base': _scalar_mult_base,
+    'from_hash_ristretto255': _from_hash_ristretto255
+}
+
+class ge25519_pool:
+    """
+    Persistent pool of worker processes (or threads) that applies a group
+    operation to every entry in a batch of inputs. Each batch is split into
+    chunks that are dispatched to the workers, and the results (binary
+    representations) are returned in the order of the inputs.
+
+    :param processes: Number of worker processes or threads (by default, the
+        number of CPUs).
+    :param chunksize: Number of inputs in each chunk (by default, chosen so
+        that each worker receives about four chunks of every batch that has a
+        known length, with at most 1024 inputs in a chunk).
+    :param pending: Largest number of chunks that have been dispatched but
+        whose results have not yet been returned (by default, twice the
+        number of workers). Inputs are consumed only as chunks are
+        dispatched, so a batch can be supplied as an iterator. Each method
+        that applies an operation returns a list of all results; a batch
+        that is too large to hold in memory (together with its results)
+        can be processed using :obj:`imap`.
+    :param field: Field element class (or name of a registered class) used by
+        the workers (see :obj:`~ge25519.ge25519.ge25519.use_field`).
+    :param threads: Whether to use worker threads rather than worker
+        processes (by default, threads are used only if the interpreter is a
+        free-threaded build of CPython in which the global interpreter lock
+        is disabled, since otherwise only one thread can run at a time).
+
+    Each worker loads the precomputed tables when it starts, so these are
+    shared by all chunks that it processes (worker threads share a single
+    copy of each table). Worker threads use the supplied field element class
+    only within the chunks that they process, so the process-wide default
+    class is not changed. A pool can be shared by multiple threads.
+
+    >>> with ge25519_pool(processes=2) as pool:
+    ...     bs = pool.scalar_mult_base([bytes([i] * 31 + [0]) for i in range(4)])
+    >>> bs == [
+    ...     ge25519_p3.scalar_mult_base(bytes([i] * 31 + [0])).to_bytes()
+    ...     for i in range(4)
+    ... ]
+    True
+    """
+    def __init__(
+            self: ge25519_pool,
+            processes: Optional[int] = None,
+            chunksize: Optional[int] = None,
+            pending: Optional[int] = None,
+            field: Union[str, type, None] = None,
+            threads: Optional[bool] = None
+        ):
+        if processes is not None and processes < 1:
+            raise ValueError('number of processes must be a positive integer')
+        if chunksize is not None and chunksize < 1:
+            raise ValueError('chunk size must be a positive integer')
+        if pending is not None and pending < 1:
+            raise ValueError('number of pending chunks must be a positive integer')
+
+        self.processes = processes or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.pending = pending or (2 * self.processes)
+        self.threads = _free_threaded() if threads is None else threads
+        self.field = field
+
+        if self.threads:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.processes,
+                initializer=_initialize,
+                initargs=(field, True)
+            )
+        else:
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_initialize,
+                initargs=(field,)
+            )
+
+    def _chunksize(self: ge25519_pool, count: Optional[int]) -> int:
+        # Number of inputs in each chunk of a batch of the specified length.
+        if self.chunksize is not None:
+            return self.chunksize
+        if count is None:
+            return 64
+        return max(1, min(1024, -(-count // (4 * self.processes))))
+
+    def _map(
+            self: ge25519_pool,
+            function: Callable[[Sequence[tuple]], Sequence[bytes]],
+            *iterables: Iterable[bytes]
+        ) -> Iterator[bytes]:
+        # Dispatch chunks of the inputs to the workers (with at most
+        # ``self.pending`` chunks in flight) and yield the results in order.
+        count = min(
+            (len(it) for it in iterables if hasattr(it, '__len__')),
+            default=None
+        )
+        chunksize = self._chunksize(count)
+        entries = zip(*iterables)
+        chunks = iter(lambda: list(itertools.islice(entries, chunksize)), [])
+        function = functools.partial(_within, self.field, function)
+
+        futures = collections.deque()
+        for chunk in itertools.islice(chunks, self.pending):
+            futures.append(self.executor.submit(function, chunk))
+
+        while futures:
+            results = futures.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                futures.append(self.executor.submit(function, chunk))
+            yield from results
+
+    def scalar_mult(
+            self: ge25519_pool,
+            scalars: Iterable[bytes],
+            points: Iterable[bytes]
+        ) -> Sequence[bytes]:
+        """
+        Multiply each element (supplied as its binary representation) by its
+        corresponding scalar (as in :obj:`~ge25519.ge25519.ge25519_p3.scalar_mult`).
+        """
+        return list(self._map(_scalar_mult, scalars, points))
+
+    def scalar_mult_ristretto255(
+            self: ge25519_pool,
+            scalars: Iterable[bytes],
+            points: Iterable[bytes]
+        ) -> Sequence[Optional[bytes]]:
+        """
+        Multiply each Ristretto point (supplied as its binary representation)
+        by its corresponding scalar. The result for a binary representation
+        that is not valid is ``None``.
+        """
+        return list(self._map(_scalar_mult_ristretto255, scalars, points))
+
+    def scalar_mult_base(self: ge25519_pool, scalars: Iterable[bytes]) -> Sequence[bytes]:
+        """
+        Multiply the base point by each scalar (as in
+        :obj:`~ge25519.ge25519.ge25519_p3.scalar_mult_base`).
+        """
+        return list(self._map(_scalar_mult_base, scalars))
+
+    def from_hash_ristretto255(
+            self: ge25519_pool,
+            hashes: Iterable[bytes]
+        ) -> Sequence[bytes]:
+        """
+        Construct a Ristretto point from each 64-byte hash value (as in
+        :obj:`~ge25519.ge25519.ge25519_p3.from_hash_ristretto255`).
+        """
+        return list(self._map(_from_hash_ristretto255, hashes))
+
+    def imap(
+            self: ge25519_pool,
+            operation: str,
+            *iterables: Iterable[bytes]
+        ) -> Iterator[Optional[bytes]]:
+        """
+        Apply an operation (the name of any of the methods above) to every
+        entry in a batch of inputs, yielding the results in the order of the
+        inputs as they become available. At most ``pending`` chunks of inputs
+        and results are held at any time, so a batch of any length can be
+        processed. Streamed batches are not reported to registered hooks
+        (see :obj:`~ge25519.ge25519.ge25519.register_hook`).
+
+        >>> with ge25519_pool(processes=2) as pool:
+        ...     results = pool.imap('scalar_mult_base', iter([bytes(32)] * 3))
+        ...     next(results) == ge25519_p3.scalar_mult_base(bytes(32)).to_bytes()
+        True
+        """
+        if operation not in _OPERATIONS:
+            raise ValueError('unknown operation: ' + operation)
+        return self._map(_OPERATIONS[operation], *iterables)
+
+    def close(self: ge25519_pool):
+        """
+        Shut down the workers (after all pending chunks are processed).
+        """
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self: ge25519_pool) -> ge25519_pool:
+        return self
+
+    def __exit__(self: ge25519_pool, *exc_info):
+        self.close()
+
+# Declare the entry points that report to registered hooks.
+ge25519._entry_point(ge25519_pool, [ # pylint: disable=protected-access
+    'scalar_mult', 'scalar_mult_ristretto255', 'scalar_mult_base', 'from_hash_ristretto255'
+], _results)
@@ -0,0 +1,169 @@
+"""
+Hook that collects telemetry (call counts, numbers of inputs, and latency
+histograms) for every entry point and that exports it in a plain-text
+format that can be scraped by a local monitoring agent.
+"""
+from __future__ import annotations
+from typing import Optional, Sequence, Tuple, TYPE_CHECKING
+import bisect
+import threading
+
+from ge25519.ge25519 import ge25519, ge25519_p3 # pylint: disable=unused-import
+
+if TYPE_CHECKING: # pragma: no cover
+    import http.server
+
+# Default upper bounds (in seconds) of the buckets of each latency histogram.
+_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+class ge25519_telemetry:
+    """
+    Hook (see :obj:`~ge25519.ge25519.ge25519.register_hook`) that maintains,
+    for every entry point, the number of invocations, the total number of
+    inputs, and a histogram of the elapsed times. The hook is registered
+    while it is used as a context manager (or between invocations of
+    :obj:`register` and :obj:`unregister`).
+
+    :param buckets: Upper bounds (in seconds) of the buckets of each latency
+        histogram (by default, bounds between ten microseconds and ten seconds).
+
+    >>> with ge25519_telemetry() as telemetry:
+    ...     p3 = ge25519_p3.scalar_mult_base(bytes(32))
+    ...     bss = ge25519_p3.to_bytes_many([p3, p3, p3])
+    >>> print(telemetry.export()) # doctest: +ELLIPSIS
+    # HELP ge25519_calls_total Number of invocations of each entry point.
+    # TYPE ge25519_calls_total counter
+    ge25519_calls_total{operation="ge25519_p3.scalar_mult_base"} 1
+    ge25519_calls_total{operation="ge25519_p3.to_bytes_many"} 1
+    # HELP ge25519_inputs_total Number of inputs supplied to each entry point.
+    # TYPE ge25519_inputs_total counter
+    ge25519_inputs_total{operation="ge25519_p3.scalar_mult_base"} 1
+    ge25519_inputs_total{operation="ge25519_p3.to_bytes_many"} 3
+    # HELP ge25519_latency_seconds Elapsed time of each invocation of each entry point.
+    # TYPE ge25519_latency_seconds histogram
+    ge25519_latency_seconds_bucket{operation="ge25519_p3.scalar_mult_base",le="1e-05"} 0
+    ...
+    ge25519_latency_seconds_count{operation="ge25519_p3.to_bytes_many"} 1
+    """
+    def __init__(self: ge25519_telemetry, buckets: Optional[Sequence[float]] = None):
+        self.buckets = _BUCKETS if buckets is None else tuple(sorted(buckets))
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.inputs = {}
+        self.seconds = {}
+        self.histograms = {} # Count for each bucket (and for the implicit last bucket).
+
+    def __call__(self: ge25519_telemetry, operation: str, size: int, seconds: float):
+        """
+        Record an invocation of an entry point.
+        """
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            if operation not in self.calls:
+                self.calls[operation] = 0
+                self.inputs[operation] = 0
+                self.seconds[operation] = 0.0
+                self.histograms[operation] = [0] * (len(self.buckets) + 1)
+            self.calls[operation] += 1
+            self.inputs[operation] += size
+            self.seconds[operation] += seconds
+            self.histograms[operation][index] += 1
+
+    def register(self: ge25519_telemetry):
+        """
+        Register this hook so that invocations of entry points are recorded.
+        """
+        ge25519.register_hook(self)
+
+    def unregister(self: ge25519_telemetry):
+        """
+        Unregister this hook (the recorded telemetry is retained).
+        """
+        ge25519.unregister_hook(self)
+
+    def __enter__(self: ge25519_telemetry) -> ge25519_telemetry:
+        self.register()
+        return self
+
+    def __exit__(self: ge25519_telemetry, *exc_info):
+        self.unregister()
+
+    def export(self: ge25519_telemetry) -> str:
+        """
+        Export the recorded telemetry in the plain-text exposition format
+        used by `Prometheus <https://prometheus.io>`__ (in which the buckets
+        of each histogram are cumulative).
+        """
+        with self.lock:
+            operations = sorted(self.calls)
+            lines = [
+                '# HELP ge25519_calls_total Number of invocations of each entry point.',
+                '# TYPE ge25519_calls_total counter'
+            ] + [
+                'ge25519_calls_total{operation="' + o + '"} ' + str(self.calls[o])
+                for o in operations
+            ] + [
+                '# HELP ge25519_inputs_total Number of inputs supplied to each entry point.',
+                '# TYPE ge25519_inputs_total counter'
+            ] + [
+                'ge25519_inputs_total{operation="' + o + '"} ' + str(self.inputs[o])
+                for o in operations
+            ] + [
+                '# HELP ge25519_latency_seconds ' +
+                    'Elapsed time of each invocation of each entry point.',
+                '# TYPE ge25519_latency_seconds histogram'
+            ]
+            for o in operations:
+                total = 0
+                for (bound, count) in zip(self.buckets + ('+Inf',), self.histograms[o]):
+                    total += count
+                    lines.append(
+                        'ge25519_latency_seconds_bucket{operation="' + o + '",le="' +
+                        (bound if isinstance(bound, str) else repr(bound)) + '"} ' + str(total)
+                    )
+                lines.append(
+                    'ge25519_latency_seconds_sum{operation="' + o + '"} ' +
+                    repr(self.seconds[o])
+                )
+                lines.append(
+                    'ge25519_latency_seconds_count{operation="' + o + '"} ' +
+                    str(self.calls[o])
+                )
+
+        return '\n'.join(lines)
+
+    def serve(
+            self: ge25519_telemetry,
+            address: Tuple[str, int] = ('127.0.0.1', 0)
+        ) -> http.server.ThreadingHTTPServer:
+        """
+        Start an HTTP server (in a daemon thread) that responds to every
+        ``GET`` request with the exported telemetry. The server (whose
+        ``server_address`` attribute contains the port on which it listens)
+        is returned so that it can be stopped using its ``shutdown`` method.
+        """
+        import http.server # pylint: disable=import-outside-toplevel,redefined-outer-name
+        telemetry = self
+
+        class handler(http.server.BaseHTTPRequestHandler):
+            """
+            Handler that responds with the exported telemetry.
+            """
+            def do_GET(self): # pylint: disable=invalid-name
+                """Respond with the exported telemetry."""
+                body = (telemetry.export() + '\n').encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args): # pylint: disable=arguments-differ
+                pass # Requests are not logged.
+
+        server = http.server.ThreadingHTTPServer(address, handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
@@ -0,0 +1,134 @@
+"""
+Test suite containing functional unit tests for the signature verification
+methods.
+"""
+# pylint: disable=missing-function-docstring
+from unittest import TestCase
+import hashlib
+
+from ge25519.ge25519 import * # pylint: disable=wildcard-import,unused-wildcard-import
+from ge25519.ed25519 import ed25519_key, ed25519
+
+# Order of the main subgroup.
+L = (2 ** 252) + 27742317777372353535851937790883648493
+
+# Test vectors (public key, message, signature) from RFC 8032 (Section 7.1)
+# and the corresponding secret keys.
+SECRET_KEYS = [
+    bytes.fromhex('9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60'),
+    bytes.fromhex('4ccd089b28ff96da9db6c346ec114e0f5b8a319f35aba624da8cf6ed4fb8a6fb')
+]
+VECTORS = [
+    (
+        bytes.fromhex('d75a980182b10ab7d54bfed3c964073a0ee172f3daa62325af021a68f707511a'),
+        b'',
+        bytes.fromhex(
+            'e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e06522490155'
+            '5fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b'
+        )
+    ),
+    (
+        bytes.fromhex('3d4017c3e843895a92b70aa74d1b7ebc9c982ccf2ec4968cc0cd55f12af4660c'),
+        bytes([0x72]),
+        bytes.fromhex(
+            '92a009a9f0d4cab8720e820b5f642540a2b27b5416503f8fb3762223ebdb69da'
+            '085ac1e43e15996e458f3613d0f11d8c387b2eaeb4302aeeb00d291612bb0c00'
+        )
+    )
+]
+
+def torsion(sk: bytes, message: bytes) -> bytes:
+    """
+    Create a signature in which the point ``R`` has a component of order 8
+    (so that it satisfies only the cofactored verification equation).
+    """
+    key = ed25519.keygen(sk)
+    r = int.from_bytes(hashlib.sha512(key.prefix + message).digest(), 'little') % L
+    t = ge25519_p3.from_bytes(bytes(ge25519._blacklist[2])) # pylint: disable=protected-access,unsubscriptable-object
+    p3 = ge25519_p3.scalar_mult_base(r.to_bytes(32, 'little'))
+    R = ge25519_p3.from_p1p1(ge25519_p1p1.add(p3, ge25519_cached.from_p3(t))).to_bytes()
+    k = int.from_bytes(hashlib.sha512(R + key.public_key + message).digest(), 'little') % L
+    a = int.from_bytes(key.scalar, 'little')
+    return R + ((r + k * a) % L).to_bytes(32, 'little')
+
+class Test_ed25519(TestCase):
+    """
+    Tests for key generation, signing, and signature verification methods.
+    """
+    def test_keygen(self):
+        for (sk, (pk, _, _)) in zip(SECRET_KEYS, VECTORS):
+            key = ed25519.keygen(sk)
+            self.assertEqual(key.public_key, pk)
+            self.assertEqual(key.seed, sk)
+            self.assertEqual(ed25519_key.from_seed(sk).public_key, pk)
+
+        key = ed25519.keygen()
+        self.assertEqual(len(key.seed), 32)
+        self.assertEqual(key.public_key, ed25519.keygen(key.seed).public_key)
+
+    def test_keygen_many(self):
+        seeds = SECRET_KEYS + [hashlib.sha256(bytes([i])).digest() for i in range(6)]
+        keys = ed25519.keygen_many(seeds)
+        self.assertEqual(
+            [(key.seed, key.scalar, key.prefix, key.public_key) for key in keys],
+            [
+                (key.seed, key.scalar, key.prefix, key.public_key)
+                for key in map(ed25519.keygen, seeds)
+            ]
+        )
+        self.assertEqual(ed25519.keygen_many([]), [])
+
+    def test_sign(self):
+        for (sk, (_, m, sig)) in zip(SECRET_KEYS, VECTORS):
+            self.assertEqual(ed25519.keygen(sk).sign(m), sig)
+
+        key = ed25519.keygen()
+        ms = [bytes([i]) * i for i in range(8)]
+        sigs = [key.sign(m) for m in ms]
+        self.assertEqual(ed25519.verify_batch(sigs, ms, [key.public_key] * 8), [True] * 8)
+
+    def test_verify(self):
+        for (sk, (pk, m, sig)) in zip(SECRET_KEYS, VECTORS):
+            self.assertTrue(ed25519.verify(sig, m, pk))
+            self.assertTrue(ed25519.verify(torsion(sk, m), m, pk))
+            self.assertFalse(ed25519.verify(sig, m + b'x', pk))
+            self.assertFalse(ed25519.verify(bytes([sig[0] ^ 1]) + sig[1:], m, pk))
+            self.assertFalse(ed25519.verify(sig[:32] + bytes([sig[32] ^ 1]) + sig[33:], m, pk))
+
+    def test_verify_rejected(self):
+        (pk, m, sig) = VECTORS[0]
+        s = int.from_bytes(sig[32:], 'little')
+        small = bytes(ge25519._blacklist[2]) # pylint: disable=protected-access,unsubscriptable-object
+        noncanonical = bytes([0xee] + [0xff] * 30 + [0x7f])
+        for (sig_, pk_) in [
+            (sig[:32] + (s + L).to_bytes(32, 'little'), pk), # Non-canonical scalar.
+            (small + sig[32:], pk), # Small-order ``R``.
+            (sig, small), # Small-order public key.
+            (noncanonical + sig[32:], pk), # Non-canonical ``R``.
+            (sig, noncanonical), # Non-canonical public key.
+            (bytes([2]) + bytes(31) + sig[32:], pk), # ``R`` is not on the curve.
+            (sig, bytes([2]) + bytes(31)), # Public key is not on the curve.
+            (sig[:63], pk),
+            (sig, pk[:31])
+        ]:
+            self.assertFalse(ed25519.verify(sig_, m, pk_))
+            self.assertEqual(ed25519.verify_batch([sig_, sig], [m, m], [pk_, pk]), [False, True])
+
+    def test_verify_batch(self):
+        (pks, ms, sigs) = (list(v) for v in zip(*(VECTORS * 4)))
+        sigs[1] = torsion(SECRET_KEYS[1], ms[1])
+        self.assertEqual(ed25519.verify_batch(sigs, ms, pks), [True] * len(sigs))
+        self.assertEqual(ed25519.verify_batch([], [], []), [])
+
+        ms[2] = ms[2] + b'x'
+        sigs[5] = sigs[5][:40] + bytes([sigs[5][40] ^ 1]) + sigs[5][41:]
+        self.assertEqual(
+            ed25519.verify_batch(sigs, ms, pks),
+            [ed25519.verify(sig, m, pk) for (sig, m, pk) in zip(sigs, ms, pks)]
+        )
+        self.assertEqual(ed25519.verify_batch(sigs, ms, pks).count(False), 2)
+
+    def test_verify_batch_mismatch(self):
+        (pk, m, sig) = VECTORS[0]
+        with self.assertRaises(ValueError):
+            ed25519.verify_batch([sig, sig], [m], [pk, pk])
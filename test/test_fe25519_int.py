@@ -0,0 +1,88 @@
+"""
+Test suite containing functional unit tests for the native integer and
+gmpy2 integer field element classes (comparing all results to those of
+:obj:`fe25519`).
+"""
+# pylint: disable=missing-function-docstring
+from unittest import TestCase
+import hashlib
+from gmpy2 import mpz # pylint: disable=no-name-in-module
+from fe25519 import fe25519
+
+from ge25519.fe25519_int import fe25519_int
+from ge25519.fe25519_gmpy2 import fe25519_gmpy2
+
+# Inputs (including boundary cases and non-canonical representations).
+INPUTS = [
+    bytes(32),
+    bytes([1] + [0] * 31),
+    bytes([0xec] + [0xff] * 30 + [0x7f]), # p-1
+    bytes([0xed] + [0xff] * 30 + [0x7f]), # p
+    bytes([0xff] * 32)
+] + [hashlib.sha256(bytes([i])).digest() for i in range(32)]
+
+def pairs():
+    """
+    Yield each input as an instance of :obj:`fe25519` and as an instance
+    of each alternative field element class.
+    """
+    for cls in (fe25519_int, fe25519_gmpy2):
+        for bs in INPUTS:
+            yield (fe25519.from_bytes(bs), cls.from_bytes(bs))
+
+class Test_fe25519_int(TestCase):
+    """
+    Tests for all class methods.
+    """
+    def test_constants(self):
+        for cls in (fe25519_int, fe25519_gmpy2):
+            for name in [
+                'd', 'd2', 'sqrtm1', 'invsqrtamd', 'onemsqd', 'sqdmone', 'sqrtadm1',
+                'curve25519_A'
+            ]:
+                self.assertIsInstance(getattr(cls, name), cls)
+                self.assertEqual(
+                    getattr(cls, name).to_bytes(),
+                    getattr(fe25519, name).to_bytes()
+                )
+            self.assertEqual(cls.zero().to_bytes(), fe25519.zero().to_bytes())
+            self.assertEqual(cls.one().to_bytes(), fe25519.one().to_bytes())
+
+    def test_unary(self):
+        for (f, g) in pairs():
+            for op in [
+                lambda x: x.copy(), lambda x: x.reduce(), lambda x: -x, abs,
+                lambda x: x.sq(), lambda x: x.sq2(), lambda x: x ** 2,
+                lambda x: x.pow22523(), lambda x: x.invert(), lambda x: ~x,
+                lambda x: x ** (-1), lambda x: x.chi25519(),
+                lambda x: x.cneg(0), lambda x: x.cneg(1)
+            ]:
+                self.assertEqual(op(g).to_bytes(), op(f).to_bytes())
+            self.assertEqual(g.is_zero(), f.is_zero())
+            self.assertEqual(g.is_negative(), f.is_negative())
+            self.assertEqual(bytes(g), bytes(f))
+            self.assertIsNone(g ** 3)
+
+    def test_binary(self):
+        for (f, g) in pairs():
+            for (f_, g_) in [(f_, type(g).from_bytes(bytes(f_))) for (f_, _) in list(pairs())[:8]]:
+                self.assertEqual((g + g_).to_bytes(), (f + f_).to_bytes())
+                self.assertEqual((g - g_).to_bytes(), (f - f_).to_bytes())
+                self.assertEqual((g * g_).to_bytes(), (f * f_).to_bytes())
+                self.assertEqual(g.cmov(g_, 0).to_bytes(), f.cmov(f_, 0).to_bytes())
+                self.assertEqual(g.cmov(g_, 1).to_bytes(), f.cmov(f_, 1).to_bytes())
+                self.assertEqual(g == g_, (f - f_).is_zero() == 1)
+
+                (x, b) = g.sqrt_ratio_m1_ristretto255(g_)
+                (y, c) = f.sqrt_ratio_m1_ristretto255(f_)
+                self.assertEqual((x.to_bytes(), b), (y.to_bytes(), c))
+
+    def test_str(self):
+        self.assertEqual(str(fe25519_int.one()), 'fe25519_int(1)')
+        self.assertEqual(repr(fe25519_int.one()), 'fe25519_int(1)')
+        self.assertEqual(str(fe25519_gmpy2.one()), 'fe25519_gmpy2(1)')
+
+    def test_gmpy2(self):
+        for (_, g) in list(pairs())[len(INPUTS):]:
+            for x in [g, g * g, g.invert(), -g, abs(g), g.sqrt_ratio_m1_ristretto255(g)[0]]:
+                self.assertIsInstance(x.n, mpz)
@@ -6,11 +6,20 @@ classes.
 from __future__ import annotations
 from typing import Union, Optional, Callable, Iterable
 from unittest import TestCase
+import sys
+import os
+import inspect
+import subprocess
+import pickle
+import threading
+import concurrent.futures
 from parts import parts
 from bitlist import bitlist
 from fountains import fountains
 
 from ge25519.ge25519 import * # pylint: disable=wildcard-import,unused-wildcard-import
+from ge25519.ge25519 import _PIPPENGER_THRESHOLD, _lazy
+from ge25519.fe25519_int import fe25519_int
 
 # Constant for the number of input-output pairs to include in each test.
 TRIALS_PER_TEST = 256
@@ -49,7 +58,7 @@ def check_or_generate_operation(
     )
     return check_or_generate(testcase, fs, bits)
 
-class Test_ge25519(TestCase):
+class Test_ge25519(TestCase): # pylint: disable=too-many-public-methods
     """
     Tests for all class methods.
     """
@@ -69,6 +78,31 @@ class Test_ge25519(TestCase):
             return bitlist([ge25519.has_small_order(bs)])
         return check_or_generate_operation(self, fun, [32], bits)
 
+    def test_is_canonical_many(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            return bitlist([
+                ge25519.is_canonical_many(bs) == \
+                    [ge25519.is_canonical(bs_) for bs_ in parts(bs, length=32)]
+            ])
+        return check_or_generate_operation(self, fun, [32] * 4, bits)
+
+    def test_has_small_order_many(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            bs = bytearray(bs)
+            # pylint: disable=protected-access,unsubscriptable-object
+            bs[32:64] = bytes(ge25519._blacklist[bs[0] % 7])
+            return bitlist([
+                ge25519.has_small_order_many(memoryview(bs)) == \
+                    [ge25519.has_small_order(bs_) for bs_ in parts(bytes(bs), length=32)]
+            ])
+        return check_or_generate_operation(self, fun, [32] * 4, bits)
+
+    def test_many_length(self):
+        with self.assertRaises(ValueError):
+            ge25519.is_canonical_many(bytes(33))
+        with self.assertRaises(ValueError):
+            ge25519.has_small_order_many(bytes(31))
+
     def test_is_on_curve(
             self,
             bits='4dbd939e58fc59860feac3f1e63fa428519472415073f2ca850b662c25bbd05b'
@@ -85,6 +119,80 @@ class Test_ge25519(TestCase):
             return bitlist([ge25519_p3.from_bytes(bs).is_on_main_subgroup()])
         return check_or_generate_operation(self, fun, [32], bits)
 
+    def test_is_on_main_subgroup_many(self, bits='ffff'):
+        def fun(bs):
+            bss = list(parts(bs, length=32))
+            p3s = [ge25519_p3.from_uniform(bs_) for bs_ in bss[:3]]
+            p3 = ge25519_p3.from_bytes(bss[3])
+            p3s = p3s + ([p3] if p3.root_check == 0 else [])
+            return bitlist([
+                ge25519_p3.is_on_main_subgroup_many(p3s, rounds=32) == \
+                    [p3.is_on_main_subgroup() for p3 in p3s]
+            ])
+        return check_or_generate_operation(self, fun, [32] * 4, bits)
+
+    def test_is_on_main_subgroup_many_empty(self):
+        self.assertEqual(ge25519_p3.is_on_main_subgroup_many([]), [])
+
+    def test_equals(self, bits='ffff'):
+        def fun(bs):
+            # pylint: disable=protected-access,unsubscriptable-object
+            (bs0, bs1, bs2) = parts(bs, length=32)
+            add = lambda p, q: ge25519_p3.from_p1p1(ge25519_p1p1.add(p, ge25519_cached.from_p3(q)))
+            p = ge25519_p3.from_uniform(bs0)
+            q = ge25519_p3.from_uniform(bs1)
+            k = fe25519.from_bytes(bs2) # Another representation of the same element.
+            r = ge25519_p3(p.X * k, p.Y * k, p.Z * k, p.T * k).freeze()
+            i = (0, 1, 4)[bs2[0] % 3] # Element of order one, two, or four.
+            t = add(p, ge25519_p3.from_bytes(bytes(ge25519._blacklist[i])))
+            e = add(p, ge25519_p3.from_bytes(bytes(ge25519._blacklist[2]))) # Order eight.
+            return bitlist([
+                p == r and r == p and hash(p.freeze()) == hash(r) and p.ristretto_equals(r) == 1 and
+                (p == q) == (p.to_bytes() == q.to_bytes()) and p != q and
+                (t == p) == (i == 1) and t.ristretto_equals(p) == 1 and
+                t.to_bytes_ristretto255() == p.to_bytes_ristretto255() and
+                e != p and e.ristretto_equals(p) == 0 and
+                p != bs0
+            ])
+        return check_or_generate_operation(self, fun, [32] * 3, bits)
+
+    def test_equals_field(self):
+        a = bytes([2] + [0] * 31)
+        for field in ['fe25519', 'int', 'gmpy2']:
+            p = ge25519_p3.scalar_mult_base(a, field=field)
+            q = ge25519_p3.from_bytes(p.to_bytes(), field=field)
+            self.assertEqual(p, q)
+            self.assertEqual(p.ristretto_equals(q), 1)
+            self.assertNotEqual(p, ge25519_p3.zero(field=field))
+
+            # Elements with coordinates of different classes can be compared.
+            for other in ['fe25519', 'int', 'gmpy2']:
+                r = ge25519_p3.from_bytes(p.to_bytes(), field=other)
+                self.assertEqual(p, r)
+                self.assertEqual(r.ristretto_equals(p), 1)
+                self.assertNotEqual(r, ge25519_p3.zero(field=field))
+                self.assertEqual(hash(p.freeze()), hash(r.freeze()))
+
+    def test_equals_other(self):
+        p = ge25519_p3.zero()
+        self.assertFalse(p == None) # pylint: disable=singleton-comparison
+        self.assertNotEqual(p, bytes(32))
+        self.assertNotEqual(p, ge25519_p2.zero())
+        self.assertIs(p.__eq__(bytes(32)), NotImplemented) # pylint: disable=unnecessary-dunder-call
+
+    def test_hash(self):
+        p = ge25519_p3.zero()
+        with self.assertRaises(TypeError):
+            hash(p) # Mutable elements are not hashable.
+
+        frozen = p.freeze()
+        self.assertEqual(hash(frozen), hash(frozen))
+        self.assertEqual(hash(frozen), hash(p.to_bytes()))
+        self.assertEqual(len({frozen, ge25519_p3.from_bytes(p.to_bytes()).freeze()}), 1)
+        with self.assertRaises(AttributeError):
+            frozen._hashed = 0 # pylint: disable=protected-access,assigning-non-slot
+        self.assertEqual(hash(pickle.loads(pickle.dumps(frozen))), hash(frozen))
+
     def test_from_p3(
             self,
             bits='37b1cbf6ef16f5a00e5470ecc6b4c93b20893bb308962300b2081e8aa7e8702a'
@@ -124,6 +232,317 @@ class Test_ge25519(TestCase):
             return ge25519_p3.from_bytes(bs1).scalar_mult(bs2).to_bytes()
         return check_or_generate_operation(self, fun, [32, 32], bits)
 
+    def test_precompute(self, bits='ffffffff'):
+        def fun(bs):
+            (bs1, bs2, (window, spacing)) = (bs[:32], bs[32:64], divmod(bs[64], 16))
+            (window, spacing) = (2 + (window % 6), 1 + (spacing % 4))
+            bs2 = bs2[:31] + bytes([bs2[31] & 127])
+            p3 = ge25519_p3.from_uniform(bs1)
+            return bitlist([
+                p3.precompute(window, spacing).scalar_mult(bs2).to_bytes() == \
+                    p3.scalar_mult(bs2).to_bytes()
+            ])
+        return check_or_generate_operation(self, fun, [32, 32, 1], bits)
+
+    def test_configure_base(self):
+        a = bytes(range(31)) + bytes([127])
+        bs = ge25519_p3.scalar_mult_base(a).to_bytes()
+        try:
+            ge25519_p3.configure_base(window=5, spacing=1)
+            self.assertEqual(ge25519_p3.scalar_mult_base(a).to_bytes(), bs)
+        finally:
+            ge25519_p3.configure_base()
+        self.assertEqual(ge25519_p3.scalar_mult_base(a).to_bytes(), bs)
+
+        p3 = ge25519_p3.zero()
+        with self.assertRaises(ValueError):
+            p3.precompute(window=8)
+        with self.assertRaises(ValueError):
+            p3.precompute(spacing=0)
+
+    def test_scalar_mult_vartime(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            (bs1, bs2) = parts(bs, length=32)
+            bs2 = bs2[:31] + bytes([bs2[31] & 127])
+            p3 = ge25519_p3.from_bytes(bs1)
+            return bitlist([
+                p3.root_check != 0 or
+                p3.scalar_mult_vartime(bs2).to_bytes() == p3.scalar_mult(bs2).to_bytes()
+            ])
+        return check_or_generate_operation(self, fun, [32, 32], bits)
+
+    def test_double_scalar_mult_vartime(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            (bs1, bs2, bs3) = parts(bs, length=32)
+            bs2 = bs2[:31] + bytes([bs2[31] & 127])
+            bs3 = bs3[:31] + bytes([bs3[31] & 127])
+            p3 = ge25519_p3.from_bytes(bs1)
+            p1p1 = ge25519_p1p1.add(
+                p3.scalar_mult(bs2),
+                ge25519_cached.from_p3(ge25519_p3.scalar_mult_base(bs3))
+            )
+            return bitlist([
+                p3.root_check != 0 or
+                ge25519_p3.double_scalar_mult_vartime(bs2, p3, bs3).to_bytes() == \
+                    ge25519_p3.from_p1p1(p1p1).to_bytes()
+            ])
+        return check_or_generate_operation(self, fun, [32, 32, 32], bits)
+
+    def test_multiscalar_mult(self, bits='ffffffff'):
+        def fun(bs):
+            bss = list(parts(bs, length=32))
+            points = [ge25519_p3.from_uniform(bs_) for bs_ in bss[:3]]
+            scalars = [bs_[:31] + bytes([bs_[31] & 127]) for bs_ in bss[3:]]
+            p3 = ge25519_p3.zero()
+            for (a, p) in zip(scalars, points):
+                p3 = ge25519_p3.from_p1p1(
+                    ge25519_p1p1.add(p3, ge25519_cached.from_p3(p.scalar_mult(a)))
+                )
+            return bitlist([
+                ge25519_p3.multiscalar_mult(scalars, points).to_bytes() == p3.to_bytes()
+            ])
+        return check_or_generate_operation(self, fun, [32] * 6, bits)
+
+    def test_multiscalar_mult_vartime(self, bits='ffffffff'):
+        def fun(bs):
+            bss = list(parts(bs, length=32))
+            points = [ge25519_p3.from_uniform(bs_) for bs_ in bss[:3]]
+            scalars = [bs_[:31] + bytes([bs_[31] & 127]) for bs_ in bss[3:]]
+            p3 = ge25519_p3.zero()
+            for (a, p) in zip(scalars, points):
+                p3 = ge25519_p3.from_p1p1(
+                    ge25519_p1p1.add(p3, ge25519_cached.from_p3(p.scalar_mult(a)))
+                )
+            pippenger = ge25519_p3._pippenger_vartime # pylint: disable=protected-access
+            return bitlist([
+                ge25519_p3.multiscalar_mult_vartime(scalars, points).to_bytes() == \
+                    p3.to_bytes() == \
+                    pippenger(scalars, points).to_bytes()
+            ])
+        return check_or_generate_operation(self, fun, [32] * 6, bits)
+
+    def test_multiscalar_mult_vartime_pippenger(self):
+        p3 = ge25519_p3.from_uniform(bytes(range(32)))
+        n = _PIPPENGER_THRESHOLD
+        scalars = [i.to_bytes(32, 'little') for i in range(n)]
+        self.assertEqual(
+            ge25519_p3.multiscalar_mult_vartime(scalars, [p3] * n).to_bytes(),
+            p3.scalar_mult(((n * (n - 1)) // 2).to_bytes(32, 'little')).to_bytes()
+        )
+
+    def test_multiscalar_mult_mismatch(self):
+        p3 = ge25519_p3.zero()
+        with self.assertRaises(ValueError):
+            ge25519_p3.multiscalar_mult([bytes(32)] * 2, [p3])
+        with self.assertRaises(ValueError):
+            ge25519_p3.multiscalar_mult_vartime([bytes(32)], [p3] * 2)
+
+    def test_freeze(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            p3 = ge25519_p3.from_uniform(bs)
+            frozen = p3.freeze()
+            p1p1 = ge25519_p1p1.add(p3, ge25519_cached.from_p3(p3).freeze())
+            frozen_p1p1 = ge25519_p1p1.add(frozen, ge25519_cached.from_p3(frozen))
+            return bitlist([
+                isinstance(frozen, ge25519_p3) and
+                frozen.freeze() is frozen and
+                frozen.to_bytes() == p3.to_bytes() and
+                ge25519_p3.from_p1p1(frozen_p1p1.freeze()).to_bytes() == \
+                    ge25519_p3.from_p1p1(p1p1).to_bytes() and
+                pickle.loads(pickle.dumps(frozen)).to_bytes() == p3.to_bytes()
+            ])
+        return check_or_generate_operation(self, fun, [32], bits)
+
+    def test_freeze_immutable(self):
+        p3 = ge25519_p3.zero()
+        self.assertFalse(hasattr(p3, '__dict__'))
+        p3.X = p3.Y # Mutable by default.
+        for p in [
+            p3, ge25519_p2.zero(), ge25519_p1p1.dbl(p3),
+            ge25519_precomp.zero(), ge25519_cached.zero()
+        ]:
+            frozen = p.freeze()
+            self.assertIs(type(pickle.loads(pickle.dumps(frozen))), type(frozen))
+            with self.assertRaises(AttributeError):
+                frozen.Z = None
+            with self.assertRaises(AttributeError):
+                del frozen.Z
+        with self.assertRaises(AttributeError):
+            ge25519_precomp._base[0][0].xy2d = None # pylint: disable=protected-access,unsubscriptable-object
+
+    def test_freeze_precomp_table(self):
+        p3 = ge25519_p3.scalar_mult_base(bytes([3] + [0] * 31))
+        table = ge25519_precomp_table.from_p3(p3, window=2, spacing=4)
+        frozen = table.freeze()
+        self.assertIsInstance(frozen, ge25519_precomp_table)
+        self.assertIs(frozen.freeze(), frozen)
+        with self.assertRaises(AttributeError):
+            frozen.table = None
+        a = bytes(range(32))
+        self.assertEqual(frozen.scalar_mult(a).to_bytes(), table.scalar_mult(a).to_bytes())
+        self.assertEqual(
+            pickle.loads(pickle.dumps(frozen)).scalar_mult(a).to_bytes(),
+            p3.scalar_mult(a).to_bytes()
+        )
+
+    def test_field(self, bits='ffff'):
+        def fun(bs):
+            (bs1, bs2, bs3) = parts(bs, length=32)
+            a = bs2[:31] + bytes([bs2[31] & 127])
+            def run(field):
+                p3 = ge25519_p3.from_uniform(bs1, field)
+                q3 = ge25519_p3.from_bytes(bs3, field)
+                r3 = ge25519_p3.from_bytes_ristretto255(p3.to_bytes_ristretto255(), field)
+                return [
+                    p3.to_bytes(), p3.to_bytes_ristretto255(), p3.mul_l().to_bytes(),
+                    r3.to_bytes(), q3.to_bytes(), q3.root_check, q3.is_on_curve(),
+                    q3.is_on_main_subgroup(), p3.scalar_mult(a).to_bytes(),
+                    p3.scalar_mult_vartime(a).to_bytes(),
+                    ge25519_p3.scalar_mult_base(a, field).to_bytes(),
+                    ge25519_p3.double_scalar_mult_vartime(a, p3, bs1[:31] + bytes(1)).to_bytes(),
+                    ge25519_p3.multiscalar_mult([a, a], [p3, p3]).to_bytes(),
+                    ge25519_p3.to_bytes_many([p3, q3]),
+                    ge25519_p3.double_to_bytes_ristretto255_many([p3, q3]),
+                    ge25519_p3.from_hash_ristretto255(bs1 + bs3, field),
+                    ge25519_p3.is_on_main_subgroup_many([p3], rounds=4)
+                ]
+            return bitlist([run(None) == run(fe25519_int) == run('int') == run('gmpy2')])
+        return check_or_generate_operation(self, fun, [32, 32, 32], bits)
+
+    def test_use_field(self):
+        a = bytes(range(31)) + bytes([127])
+        bs = ge25519_p3.scalar_mult_base(a).to_bytes()
+        try:
+            ge25519.use_field(fe25519_int)
+            ge25519_p3.configure_base(window=5, spacing=1)
+            p3 = ge25519_p3.scalar_mult_base(a)
+            self.assertIsInstance(p3.X, fe25519_int)
+            self.assertIsInstance(ge25519_p3.zero().X, fe25519_int)
+            self.assertEqual(p3.to_bytes(), bs)
+            self.assertEqual(ge25519_p3.scalar_mult_base(a, fe25519).to_bytes(), bs)
+        finally:
+            ge25519_p3.configure_base()
+            ge25519.use_field(fe25519)
+        self.assertIsInstance(ge25519_p3.scalar_mult_base(a).X, fe25519)
+
+    def test_using_field(self):
+        a = bytes(range(31)) + bytes([127])
+        bs = ge25519_p3.scalar_mult_base(a).to_bytes()
+        with ge25519.using_field('gmpy2'):
+            self.assertEqual(type(ge25519_p3.scalar_mult_base(a).X).__name__, 'fe25519_gmpy2')
+            self.assertEqual(ge25519_p3.scalar_mult_base(a).to_bytes(), bs)
+            with ge25519.using_field(fe25519_int):
+                self.assertIsInstance(ge25519_p3.from_bytes(bs).X, fe25519_int)
+            self.assertEqual(type(ge25519_p2.zero().X).__name__, 'fe25519_gmpy2')
+        self.assertIsInstance(ge25519_p3.from_bytes(bs).X, fe25519)
+        self.assertIn('gmpy2', ge25519.fields())
+
+        with self.assertRaises(ValueError):
+            ge25519.use_field('unknown')
+        with self.assertRaises(ValueError):
+            ge25519_p3.from_bytes(bs, 'unknown')
+        self.assertIsInstance(ge25519_p3.zero().X, fe25519)
+
+    def test_field_load(self):
+        # pylint: disable=protected-access
+        fields = dict(ge25519._fields)
+        mul = fe25519_int.__mul__
+        try:
+            ge25519._fields['missing'] = 'fe25519_missing'
+            with self.assertRaises(ImportError):
+                ge25519_p3.zero('missing')
+
+            # Classes loaded while field operations are counted (including
+            # inherited methods) are instrumented.
+            ge25519._fields.update({'int': 'fe25519_int', 'gmpy2': 'fe25519_gmpy2'})
+            with ge25519.counting() as counts:
+                ge25519_p3.from_p1p1(ge25519_p3.zero('gmpy2').dbl())
+            self.assertEqual(dict(counts), {'sq': 4, 'mul': 4})
+            self.assertEqual(ge25519._fields['int'], 'fe25519_int') # Not yet selected.
+            self.assertIs(type(ge25519_p3.zero('int').X), fe25519_int)
+        finally:
+            ge25519._fields.clear()
+            ge25519._fields.update(fields)
+        self.assertIs(fe25519_int.__mul__, mul) # Methods are restored.
+
+    def test_import(self):
+        # The modules that define the alternative field element classes are
+        # not imported until these classes are selected, and optional modules
+        # (and their dependencies) are not imported with the package.
+        modules = [
+            'ge25519.fe25519_gmpy2', 'ge25519.ge25519_pool', 'ge25519.ge25519_async',
+            'ge25519.ge25519_telemetry', 'asyncio', 'concurrent.futures', 'http.server'
+        ]
+        process = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import sys, ge25519; print(any(m in sys.modules for m in ' + repr(modules) + '))'
+            ],
+            env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+            stdout=subprocess.PIPE,
+            check=True
+        )
+        self.assertEqual(process.stdout.strip(), b'False')
+
+    def test_counting(self):
+        a = bytes(range(31)) + bytes([127])
+        p3 = ge25519_p3.from_bytes(ge25519_p3.scalar_mult_base(a).to_bytes())
+        mul = fe25519.__mul__
+        results = []
+        for field in ['fe25519', 'int', 'gmpy2']:
+            with ge25519.using_field(field):
+                p = ge25519_p3.from_bytes(p3.to_bytes())
+                with ge25519.counting() as counts:
+                    with ge25519.counting() as inner:
+                        ge25519_p3.from_p1p1(p.dbl())
+                    self.assertEqual(dict(inner), {'sq': 4, 'mul': 4})
+                    p.scalar_mult(a).to_bytes_ristretto255()
+                    ge25519_p3.from_bytes_ristretto255(bytes(32))
+                    _ = p.Y.chi25519()
+                results.append(counts)
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        self.assertEqual(set(results[0]), {'mul', 'sq', 'sqrt', 'chi', 'cmov'})
+        self.assertIs(fe25519.__mul__, mul) # Methods are restored.
+
+        with ge25519.counting() as counts:
+            with concurrent.futures.ThreadPoolExecutor(1) as executor:
+                executor.submit(p3.dbl).result() # Not counted in this scope.
+            ge25519_p3.from_bytes(p3.to_bytes())
+        self.assertEqual(counts['invert'], 1)
+        self.assertEqual(counts['pow22523'], 1)
+
+    def test_threads(self):
+        # The tables are built (once) concurrently by several threads.
+        # pylint: disable=protected-access
+        a = bytes(range(31)) + bytes([127])
+        bs = ge25519_p3.scalar_mult_base(a).to_bytes()
+        (bases, tables) = (ge25519_precomp._bases, ge25519_precomp_table._bases)
+        try:
+            (ge25519_precomp._bases, ge25519_precomp_table._bases) = ({}, {})
+            barrier = threading.Barrier(4)
+            def work(_):
+                barrier.wait()
+                with ge25519.using_field('int'):
+                    return (
+                        ge25519_p3.scalar_mult_base(a).to_bytes(),
+                        ge25519_precomp_table._base(fe25519_int)
+                    )
+            with concurrent.futures.ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(work, range(4)))
+            self.assertEqual({r for (r, _) in results}, {bs})
+            self.assertEqual(len({id(t) for (_, t) in results}), 1)
+        finally:
+            (ge25519_precomp._bases, ge25519_precomp_table._bases) = (bases, tables)
+
+        calls = []
+        class owner: # pylint: disable=too-few-public-methods
+            """Class with a lazily computed attribute."""
+            table = _lazy('table', lambda: calls.append(None) or len(calls))
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            self.assertEqual(set(executor.map(lambda _: owner.table, range(8))), {1})
+        self.assertEqual(len(calls), 1)
+
     def test_from_uniform(
             self,
             bits='fa3b6f0f3a7222b45d44ac42eb03f7beec0039f61f0814a4f3a2f178e44fd26d'
@@ -146,6 +565,17 @@ class Test_ge25519(TestCase):
             return p3.to_bytes() if p3 is not None else bitlist([0])
         return check_or_generate_operation(self, fun, [32], bits)
 
+    def test_to_bytes_many(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            p3s = [
+                ge25519_p3.from_p1p1(ge25519_p3.from_bytes(bs_).dbl())
+                for bs_ in parts(bs, length=32)
+            ]
+            return bitlist([
+                ge25519_p3.to_bytes_many(p3s) == [p3.to_bytes() for p3 in p3s]
+            ])
+        return check_or_generate_operation(self, fun, [32, 32, 32], bits)
+
     def test_to_bytes_ristretto255(
             self,
             bits='4240c56beef1f9d6b8dfe7856fbae94999b8bc5e27b350f01ee5db7ee2b5ad45'
@@ -153,6 +583,27 @@ class Test_ge25519(TestCase):
         fun = lambda bs: ge25519_p3.from_bytes(bs).to_bytes_ristretto255()
         return check_or_generate_operation(self, fun, [32], bits)
 
+    def test_to_bytes_ristretto255_many(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            p3s = [ge25519_p3.from_bytes(bs_) for bs_ in parts(bs, length=32)]
+            return bitlist([
+                ge25519_p3.to_bytes_ristretto255_many(p3s) == \
+                    [p3.to_bytes_ristretto255() for p3 in p3s]
+            ])
+        return check_or_generate_operation(self, fun, [32, 32, 32], bits)
+
+    def test_double_to_bytes_ristretto255_many(self, bits='ffffffffffffffff'):
+        def fun(bs):
+            p3s = [ge25519_p3.from_bytes(bs_) for bs_ in parts(bs, length=32)]
+            p3s = [p3 for p3 in p3s if p3.root_check == 0] + [ge25519_p3.zero()]
+            return bitlist([
+                ge25519_p3.double_to_bytes_ristretto255_many(p3s) == [
+                    ge25519_p3.from_p1p1(p3.dbl()).to_bytes_ristretto255()
+                    for p3 in p3s
+                ]
+            ])
+        return check_or_generate_operation(self, fun, [32, 32, 32], bits)
+
     def test_add(self, bits='f9a298467cf064593c9998917f3e2b1fb00f738e92e3c3187ce9986b70389245'):
         def fun(bs):
             (bs1, bs2) = parts(bs, length=32)
@@ -169,6 +620,14 @@ class Test_ge25519(TestCase):
             return ge25519_p3.from_p1p1(p2.dbl()).to_bytes()
         return check_or_generate_operation(self, fun, [32, 1], bits)
 
+    def test_msub(self, bits='7cdd2fd5e7befea1a7102c6a16ee5d33fcb75de23b769067b1396d4ccbec74a0'):
+        def fun(bs):
+            (p3, i, j) = (ge25519_p3.from_bytes(bs[:32]), bs[32]%32, (bs[32]//32)%8)
+            # pylint: disable=protected-access,unsubscriptable-object
+            p2 = ge25519_p2.from_p1p1(ge25519_p1p1.msub(p3, ge25519_precomp._base[i][j]))
+            return ge25519_p3.from_p1p1(p2.dbl()).to_bytes()
+        return check_or_generate_operation(self, fun, [32, 1], bits)
+
     def test_sub(self, bits='c349d67e124af7943ee8ceeaf774c43fca0472c245dad7e52585c62e71343082'):
         def fun(bs):
             (bs1, bs2) = parts(bs, length=32)
@@ -210,4 +669,5 @@ if __name__ == '__main__':
     # Generate specifications for tests.
     test_ge25519 = Test_ge25519()
     for m in [m for m in dir(test_ge25519) if m.startswith('test_')]:
-        print(m + ': ' + getattr(test_ge25519, m)(bits=None))
+        if 'bits' in inspect.signature(getattr(test_ge25519, m)).parameters:
+            print(m + ': ' + getattr(test_ge25519, m)(bits=None))
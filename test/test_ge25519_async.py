@@ -0,0 +1,129 @@
+"""
+Test suite containing functional unit tests for the asynchronous interface
+(comparing all results to those of the individual element methods).
+"""
+# pylint: disable=missing-function-docstring
+from unittest import TestCase
+import asyncio
+import hashlib
+import concurrent.futures
+
+from ge25519.ge25519 import ge25519_p3
+from ge25519.fe25519_int import fe25519_int
+from ge25519.ge25519_async import ge25519_async
+
+# Inputs (scalars, points, and hash values).
+SCALARS = [hashlib.sha256(bytes([i])).digest()[:31] + bytes(1) for i in range(10)]
+POINTS = [ge25519_p3.from_uniform(hashlib.sha256(bytes([i, 1])).digest()) for i in range(10)]
+HASHES = [hashlib.sha512(bytes([i])).digest() for i in range(10)]
+
+class executor(concurrent.futures.ThreadPoolExecutor):
+    """
+    Executor that records the size of every batch that it processes.
+    """
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.sizes = []
+
+    def submit(self, *args, **kwargs): # pylint: disable=arguments-differ
+        self.sizes.append(len(args[1]))
+        return super().submit(*args, **kwargs)
+
+class Test_ge25519_async(TestCase):
+    """
+    Tests for all methods of the asynchronous interface.
+    """
+    def test_operations(self):
+        async def main():
+            async with ge25519_async(latency=0.01) as facade:
+                return await asyncio.gather(
+                    asyncio.gather(*[facade.scalar_mult(p, s) for (p, s) in zip(POINTS, SCALARS)]),
+                    asyncio.gather(*[facade.scalar_mult_base(s) for s in SCALARS]),
+                    asyncio.gather(*[facade.from_hash_ristretto255(h) for h in HASHES]),
+                    asyncio.gather(*[facade.to_bytes(p) for p in POINTS]),
+                    asyncio.gather(*[facade.to_bytes_ristretto255(p) for p in POINTS])
+                )
+
+        (products, bases, hashed, encoded, encoded_ristretto255) = asyncio.run(main())
+        self.assertEqual(
+            [p.to_bytes() for p in products],
+            [p.scalar_mult(s).to_bytes() for (p, s) in zip(POINTS, SCALARS)]
+        )
+        self.assertEqual(
+            [p.to_bytes() for p in bases],
+            [ge25519_p3.scalar_mult_base(s).to_bytes() for s in SCALARS]
+        )
+        self.assertEqual(hashed, [ge25519_p3.from_hash_ristretto255(h) for h in HASHES])
+        self.assertEqual(encoded, [p.to_bytes() for p in POINTS])
+        self.assertEqual(encoded_ristretto255, [p.to_bytes_ristretto255() for p in POINTS])
+
+    def test_batches(self):
+        async def main(facade):
+            results = await asyncio.gather(*[facade.to_bytes(p) for p in POINTS])
+            await facade.close()
+            return results
+
+        with executor() as pool:
+            results = asyncio.run(main(ge25519_async(pool, latency=10, size=4)))
+            self.assertEqual(results, [p.to_bytes() for p in POINTS])
+            self.assertEqual(pool.sizes, [4, 4, 2])
+
+        with executor() as pool:
+            async def sequential(facade):
+                return [await facade.to_bytes(p) for p in POINTS[:2]]
+            results = asyncio.run(sequential(ge25519_async(pool, latency=0)))
+            self.assertEqual(results, [p.to_bytes() for p in POINTS[:2]])
+            self.assertEqual(pool.sizes, [1, 1])
+
+        with executor() as pool:
+            async def flushed(facade):
+                tasks = [asyncio.ensure_future(facade.to_bytes(p)) for p in POINTS[:3]]
+                await asyncio.sleep(0) # Requests are queued (but not dispatched).
+                await facade.flush()
+                return await asyncio.gather(*tasks)
+            results = asyncio.run(flushed(ge25519_async(pool, latency=10)))
+            self.assertEqual(results, [p.to_bytes() for p in POINTS[:3]])
+            self.assertEqual(pool.sizes, [3])
+
+    def test_field(self):
+        async def main():
+            async with ge25519_async(field='int') as facade:
+                return await facade.scalar_mult_base(SCALARS[0])
+
+        p = asyncio.run(main())
+        self.assertIsInstance(p.X, fe25519_int)
+        self.assertEqual(p.to_bytes(), ge25519_p3.scalar_mult_base(SCALARS[0]).to_bytes())
+
+    def test_errors(self):
+        async def main():
+            async with ge25519_async() as facade:
+                cancelled = asyncio.ensure_future(facade.to_bytes(POINTS[0]))
+                failed = asyncio.gather(
+                    facade.scalar_mult(POINTS[0], SCALARS[0]),
+                    facade.scalar_mult(None, SCALARS[0]),
+                    return_exceptions=True
+                )
+                await asyncio.sleep(0)
+                cancelled.cancel()
+                return await failed
+
+        results = asyncio.run(main())
+        self.assertIsInstance(results[0], AttributeError)
+        self.assertIsInstance(results[1], AttributeError)
+
+        async def cancelled():
+            facade = ge25519_async(latency=10, size=2)
+            requests = [asyncio.ensure_future(facade.to_bytes(p)) for p in POINTS[:2]]
+            await asyncio.sleep(0) # The batch is dispatched once it is full.
+            for batch in list(facade.batches):
+                batch.cancel()
+            return await asyncio.wait_for(
+                asyncio.gather(*requests, return_exceptions=True), timeout=10
+            )
+
+        results = asyncio.run(cancelled())
+        self.assertTrue(all(isinstance(r, asyncio.CancelledError) for r in results))
+
+        for kwargs in [{'latency': -1}, {'size': 0}]:
+            with self.assertRaises(ValueError):
+                ge25519_async(**kwargs)
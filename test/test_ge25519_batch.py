@@ -0,0 +1,231 @@
+"""
+Test suite containing functional unit tests for the batch classes
+(comparing all results to those of the individual element classes).
+"""
+# pylint: disable=missing-function-docstring
+from unittest import TestCase
+import sys
+import hashlib
+import numpy as np
+
+from ge25519.ge25519 import * # pylint: disable=wildcard-import,unused-wildcard-import
+from ge25519.fe25519_int import fe25519_int
+from ge25519.ge25519_batch import \
+    ge25519_p3_batch, ge25519_p1p1_batch, ge25519_precomp_batch, ge25519_cached_batch
+
+# Module containing the batch classes.
+ge25519_batch = sys.modules['ge25519.ge25519_batch']
+
+# Points (including the zero element and elements of small order).
+POINTS = [ge25519_p3.zero(), ge25519_p3.from_bytes(bytes(ge25519._blacklist[2]))] + [ # pylint: disable=protected-access,unsubscriptable-object
+    ge25519_p3.from_uniform(hashlib.sha256(bytes([i])).digest()) for i in range(30)
+]
+
+def array(bss):
+    """
+    Array of shape ``(N, 32)`` containing a sequence of 32-byte values.
+    """
+    return np.frombuffer(b''.join(bss), dtype=np.uint8).reshape(-1, 32)
+
+def coordinates(points):
+    """
+    Byte representations of the coordinates of each element in a sequence
+    (the slots of the immutable variant of a class are inherited).
+    """
+    return [
+        [
+            getattr(p, name).to_bytes()
+            for name in next(c.__slots__ for c in type(p).__mro__ if c.__slots__)
+            if name != 'root_check'
+        ]
+        for p in points
+    ]
+
+class Test_ge25519_batch(TestCase):
+    """
+    Tests for all batch class methods.
+    """
+    def test_points(self):
+        b = ge25519_p3_batch.from_points(POINTS)
+        self.assertEqual(len(b), len(POINTS))
+        self.assertEqual(coordinates(b.to_points()), coordinates(POINTS))
+        self.assertTrue(all(isinstance(p.X, fe25519_int) for p in b.to_points('int')))
+        self.assertEqual(coordinates(b.to_points(fe25519_int)), coordinates(POINTS))
+        self.assertEqual(ge25519_p3_batch.from_points([]).to_points(), [])
+
+    def test_dbl(self):
+        b = ge25519_p3_batch.from_points(POINTS)
+        self.assertEqual(
+            coordinates(b.dbl().to_points()),
+            coordinates([p.dbl() for p in POINTS])
+        )
+        self.assertEqual(
+            coordinates(ge25519_p1p1_batch.dbl(b).to_points()),
+            coordinates([ge25519_p1p1.dbl(p) for p in POINTS])
+        )
+
+    def test_from_p1p1(self):
+        p1p1s = [p.dbl() for p in POINTS]
+        self.assertEqual(
+            coordinates(ge25519_p3_batch.from_p1p1(
+                ge25519_p1p1_batch.from_points(p1p1s)
+            ).to_points()),
+            coordinates([ge25519_p3.from_p1p1(p) for p in p1p1s])
+        )
+
+    def test_from_p3(self):
+        b = ge25519_cached_batch.from_p3(ge25519_p3_batch.from_points(POINTS))
+        self.assertEqual(
+            coordinates(b.to_points()),
+            coordinates([ge25519_cached.from_p3(p) for p in POINTS])
+        )
+
+    def test_add(self):
+        qs = POINTS[::-1]
+        b = ge25519_p1p1_batch.add(
+            ge25519_p3_batch.from_points(POINTS),
+            ge25519_cached_batch.from_p3(ge25519_p3_batch.from_points(qs))
+        )
+        self.assertEqual(
+            coordinates(b.to_points()),
+            coordinates([
+                ge25519_p1p1.add(p, ge25519_cached.from_p3(q))
+                for (p, q) in zip(POINTS, qs)
+            ])
+        )
+
+    def test_madd(self):
+        qs = [q for row in ge25519_precomp._base[:4] for q in row][:len(POINTS)] # pylint: disable=protected-access,unsubscriptable-object
+        b = ge25519_p1p1_batch.madd(
+            ge25519_p3_batch.from_points(POINTS),
+            ge25519_precomp_batch.from_points(qs)
+        )
+        self.assertEqual(
+            coordinates(b.to_points()),
+            coordinates([ge25519_p1p1.madd(p, q) for (p, q) in zip(POINTS, qs)])
+        )
+        self.assertEqual(
+            coordinates(ge25519_precomp_batch.from_points(qs).to_points()),
+            coordinates(qs)
+        )
+
+    def test_chain(self):
+        b = ge25519_p3_batch.from_points(POINTS)
+        c = ge25519_cached_batch.from_p3(b)
+        ps = list(POINTS)
+        for _ in range(16):
+            b = ge25519_p3_batch.from_p1p1(ge25519_p1p1_batch.add(
+                ge25519_p3_batch.from_p1p1(b.dbl()), c
+            ))
+            ps = [
+                ge25519_p3.from_p1p1(ge25519_p1p1.add(
+                    ge25519_p3.from_p1p1(p.dbl()), ge25519_cached.from_p3(q)
+                ))
+                for (p, q) in zip(ps, POINTS)
+            ]
+        self.assertEqual(
+            [p.to_bytes() for p in b.to_points()],
+            [p.to_bytes() for p in ps]
+        )
+
+
+    def test_scalar_mult_base(self):
+        scalars = array([bytes(32), bytes([255] * 31 + [127])] + [
+            hashlib.sha256(bytes([i])).digest()[:31] + bytes([i]) for i in range(30)
+        ])
+        bs = ge25519_p3_batch.scalar_mult_base(scalars).to_bytes()
+        self.assertEqual(bs.shape, (len(scalars), 32))
+        self.assertEqual(
+            [bytes(b) for b in bs],
+            [ge25519_p3.scalar_mult_base(bytes(a)).to_bytes() for a in scalars]
+        )
+        self.assertEqual(ge25519_p3_batch.scalar_mult_base(array([])).to_bytes().shape, (0, 32))
+        with self.assertRaises(ValueError):
+            ge25519_p3_batch.scalar_mult_base(np.zeros((2, 31), dtype=np.uint8))
+
+    def test_dtype(self):
+        for a in [
+            np.array([[256] + [0] * 31]), # Would wrap around to zero.
+            np.array([[-1] * 32]), # Would wrap around to 255.
+            np.zeros((2, 32), dtype=np.int64),
+            np.zeros((2, 32), dtype=np.float64)
+        ]:
+            for method in [
+                ge25519_p3_batch.from_bytes,
+                ge25519_p3_batch.from_bytes_ristretto255,
+                ge25519_p3_batch.scalar_mult_base
+            ]:
+                with self.assertRaisesRegex(ValueError, 'dtype uint8'):
+                    method(a)
+
+    def test_scalar_mult_base_chunks(self):
+        scalars = array([hashlib.sha256(bytes([i])).digest()[:31] + bytes(1) for i in range(5)])
+        chunk = ge25519_batch._CHUNK # pylint: disable=protected-access
+        try:
+            ge25519_batch._CHUNK = 2 # pylint: disable=protected-access
+            bs = ge25519_p3_batch.scalar_mult_base(scalars).to_bytes()
+        finally:
+            ge25519_batch._CHUNK = chunk # pylint: disable=protected-access
+        self.assertEqual(bs.tobytes(), ge25519_p3_batch.scalar_mult_base(scalars).to_bytes().tobytes())
+
+    def test_to_bytes(self):
+        b = ge25519_p3_batch.from_points(POINTS)
+        self.assertEqual([bytes(bs) for bs in b.to_bytes()], [p.to_bytes() for p in POINTS])
+        p1p1 = ge25519_p1p1_batch.dbl(b)
+        self.assertEqual(
+            [bytes(bs) for bs in ge25519_p3_batch.from_p1p1(p1p1).to_bytes()],
+            ge25519_p3.to_bytes_many([ge25519_p3.from_p1p1(p.dbl()) for p in POINTS])
+        )
+
+    def test_from_bytes(self):
+        bss = [p.to_bytes() for p in POINTS] + [
+            bytes(b) for b in ge25519._blacklist # pylint: disable=protected-access,not-an-iterable
+        ] + [
+            hashlib.sha256(bytes([i])).digest() for i in range(64)
+        ] + [bytes([0xed] + [0xff] * 30 + [0xff]), bytes([0xff] * 32)]
+        (batch, mask) = ge25519_p3_batch.from_bytes(array(bss))
+        p3s = [ge25519_p3.from_bytes(bs) for bs in bss]
+        self.assertEqual(mask.tolist(), [p.root_check == 0 for p in p3s])
+        self.assertTrue(0 < mask.sum() < len(bss))
+        self.assertEqual(
+            [c for (c, m) in zip(coordinates(batch.to_points()), mask) if m],
+            [c for (c, p) in zip(coordinates(p3s), p3s) if p.root_check == 0]
+        )
+
+    def test_from_bytes_ristretto255(self):
+        bss = [p.to_bytes_ristretto255() for p in POINTS] + [
+            hashlib.sha256(bytes([i])).digest() for i in range(64)
+        ] + [bytes(32), bytes([1] + [0] * 31)]
+        (batch, mask) = ge25519_p3_batch.from_bytes_ristretto255(array(bss))
+        p3s = [ge25519_p3.from_bytes_ristretto255(bs) for bs in bss]
+        self.assertEqual(mask.tolist(), [p is not None for p in p3s])
+        self.assertTrue(0 < mask.sum() < len(bss))
+        self.assertEqual(
+            [c for (c, m) in zip(coordinates(batch.to_points()), mask) if m],
+            coordinates([p for p in p3s if p is not None])
+        )
+
+    def test_to_bytes_ristretto255(self):
+        b = ge25519_p3_batch.from_p1p1(ge25519_p1p1_batch.dbl(ge25519_p3_batch.from_points(POINTS)))
+        self.assertEqual(
+            [bytes(bs) for bs in b.to_bytes_ristretto255()],
+            [p.to_bytes_ristretto255() for p in b.to_points()]
+        )
+
+    def test_chunks(self):
+        b = ge25519_p3_batch.from_points(POINTS[2:7])
+        (bs, rs) = (b.to_bytes(), b.to_bytes_ristretto255())
+        chunk = ge25519_batch._CHUNK # pylint: disable=protected-access
+        try:
+            ge25519_batch._CHUNK = 2 # pylint: disable=protected-access
+            self.assertEqual(len(b[1:4]), 3)
+            self.assertEqual(b.to_bytes_ristretto255().tobytes(), rs.tobytes())
+            (b_, mask) = ge25519_p3_batch.from_bytes(bs)
+            self.assertEqual((b_.to_bytes().tobytes(), mask.tolist()), (bs.tobytes(), [True] * 5))
+            (b_, mask) = ge25519_p3_batch.from_bytes_ristretto255(rs)
+            self.assertEqual(
+                (b_.to_bytes_ristretto255().tobytes(), mask.tolist()),
+                (rs.tobytes(), [True] * 5)
+            )
+        finally:
+            ge25519_batch._CHUNK = chunk # pylint: disable=protected-access
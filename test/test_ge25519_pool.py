@@ -0,0 +1,146 @@
+"""
+Test suite containing functional unit tests for the pool of worker
+processes or threads (comparing all results to those of the individual
+element methods).
+"""
+# pylint: disable=missing-function-docstring
+from unittest import TestCase
+import sys
+import itertools
+import hashlib
+from fe25519 import fe25519
+
+from ge25519.ge25519 import ge25519, ge25519_p3
+from ge25519.ge25519_pool import ge25519_pool
+
+# Module containing the worker functions.
+ge25519_pool_module = sys.modules['ge25519.ge25519_pool']
+
+# Inputs (scalars, binary representations of points, and hash values).
+SCALARS = [hashlib.sha256(bytes([i])).digest()[:31] + bytes(1) for i in range(10)]
+POINTS = [ge25519_p3.from_uniform(hashlib.sha256(bytes([i, 1])).digest()) for i in range(10)]
+HASHES = [hashlib.sha512(bytes([i])).digest() for i in range(10)]
+
+class Test_ge25519_pool(TestCase):
+    """
+    Tests for all methods of the pool.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ge25519_pool(processes=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_scalar_mult(self):
+        bss = [p.to_bytes() for p in POINTS]
+        self.assertEqual(
+            self.pool.scalar_mult(SCALARS, bss),
+            [p.scalar_mult(s).to_bytes() for (s, p) in zip(SCALARS, POINTS)]
+        )
+
+    def test_scalar_mult_ristretto255(self):
+        bss = [p.to_bytes_ristretto255() for p in POINTS] + [bytes([1] + [0] * 31)]
+        self.assertEqual(
+            self.pool.scalar_mult_ristretto255(SCALARS + [SCALARS[0]], bss),
+            [p.scalar_mult(s).to_bytes_ristretto255() for (s, p) in zip(SCALARS, POINTS)] +
+            [None]
+        )
+
+    def test_scalar_mult_base(self):
+        self.assertEqual(
+            self.pool.scalar_mult_base(SCALARS),
+            [ge25519_p3.scalar_mult_base(s).to_bytes() for s in SCALARS]
+        )
+        self.assertEqual(self.pool.scalar_mult_base([]), [])
+
+    def test_from_hash_ristretto255(self):
+        self.assertEqual(
+            self.pool.from_hash_ristretto255(iter(HASHES)),
+            [ge25519_p3.from_hash_ristretto255(h) for h in HASHES]
+        )
+
+    def test_imap(self):
+        bss = [p.to_bytes() for p in POINTS]
+        self.assertEqual(
+            list(self.pool.imap('scalar_mult', iter(SCALARS), bss)),
+            self.pool.scalar_mult(SCALARS, bss)
+        )
+
+        # Inputs are consumed (and results produced) only as they are needed.
+        consumed = []
+        def scalars():
+            for i in itertools.count():
+                consumed.append(i)
+                yield SCALARS[i % len(SCALARS)]
+        with ge25519_pool(processes=1, chunksize=2, pending=2) as pool:
+            results = pool.imap('scalar_mult_base', scalars())
+            self.assertEqual(
+                list(itertools.islice(results, 3)),
+                [ge25519_p3.scalar_mult_base(s).to_bytes() for s in SCALARS[:3]]
+            )
+            self.assertEqual(len(consumed), 8) # At most two pending chunks.
+            results.close()
+
+        with self.assertRaises(ValueError):
+            self.pool.imap('unknown', SCALARS)
+
+    def test_options(self):
+        with ge25519_pool(processes=1, chunksize=3, pending=1, field='int') as pool:
+            self.assertEqual(
+                pool.from_hash_ristretto255(h for h in HASHES),
+                [ge25519_p3.from_hash_ristretto255(h) for h in HASHES]
+            )
+        self.assertEqual(self.pool._chunksize(None), 64) # pylint: disable=protected-access
+        self.assertEqual(self.pool._chunksize(10 ** 6), 1024) # pylint: disable=protected-access
+        self.assertEqual(self.pool._chunksize(16), 2) # pylint: disable=protected-access
+
+        for kwargs in [{'processes': 0}, {'chunksize': 0}, {'pending': 0}]:
+            with self.assertRaises(ValueError):
+                ge25519_pool(**kwargs)
+
+    def test_threads(self):
+        bss = [p.to_bytes() for p in POINTS]
+        with ge25519_pool(processes=4, chunksize=2, threads=True, field='int') as pool:
+            self.assertTrue(pool.threads)
+            self.assertEqual(
+                pool.scalar_mult(SCALARS, bss),
+                [p.scalar_mult(s).to_bytes() for (s, p) in zip(SCALARS, POINTS)]
+            )
+            self.assertEqual(
+                pool.scalar_mult_base(SCALARS),
+                [ge25519_p3.scalar_mult_base(s).to_bytes() for s in SCALARS]
+            )
+        self.assertIsInstance(ge25519_p3.zero().X, fe25519) # Default is unchanged.
+        self.assertEqual(
+            self.pool.threads,
+            ge25519_pool_module._free_threaded() # pylint: disable=protected-access
+        )
+
+    def test_workers(self):
+        # The worker functions are also invoked directly (so that their
+        # coverage is measured within this process).
+        # pylint: disable=protected-access
+        try:
+            ge25519_pool_module._initialize('int')
+            self.assertEqual(
+                ge25519_pool_module._scalar_mult_base([(s,) for s in SCALARS]),
+                [ge25519_p3.scalar_mult_base(s, fe25519).to_bytes() for s in SCALARS]
+            )
+        finally:
+            ge25519.use_field(fe25519)
+        ge25519_pool_module._initialize(None)
+        bss = [p.to_bytes_ristretto255() for p in POINTS]
+        self.assertEqual(
+            ge25519_pool_module._scalar_mult_ristretto255(list(zip(SCALARS, bss))),
+            self.pool.scalar_mult_ristretto255(SCALARS, bss)
+        )
+        self.assertEqual(
+            ge25519_pool_module._scalar_mult(list(zip(SCALARS, [p.to_bytes() for p in POINTS]))),
+            self.pool.scalar_mult(SCALARS, [p.to_bytes() for p in POINTS])
+        )
+        self.assertEqual(
+            ge25519_pool_module._from_hash_ristretto255([(h,) for h in HASHES]),
+            self.pool.from_hash_ristretto255(HASHES)
+        )
@@ -0,0 +1,179 @@
+"""
+Test suite containing functional unit tests for the hook registry and for
+the telemetry hook.
+"""
+# pylint: disable=missing-function-docstring
+from unittest import TestCase
+import asyncio
+import hashlib
+import concurrent.futures
+import urllib.request
+import numpy as np
+
+from ge25519.ge25519 import ge25519, ge25519_p3
+from ge25519.ed25519 import ed25519
+from ge25519.ge25519_batch import ge25519_p3_batch
+from ge25519.ge25519_pool import ge25519_pool
+from ge25519.ge25519_async import ge25519_async
+from ge25519.ge25519_telemetry import ge25519_telemetry
+
+# Inputs (scalars and points).
+SCALARS = [hashlib.sha256(bytes([i])).digest()[:31] + bytes(1) for i in range(4)]
+POINTS = [ge25519_p3.from_uniform(hashlib.sha256(bytes([i, 1])).digest()) for i in range(4)]
+
+class Test_ge25519_telemetry(TestCase):
+    """
+    Tests for the hook registry and for all methods of the telemetry hook.
+    """
+    def test_hooks(self):
+        calls = []
+        hook = lambda operation, size, seconds: calls.append((operation, size))
+        scalar_mult = vars(ge25519_p3)['scalar_mult']
+        ge25519.register_hook(hook)
+        try:
+            p = POINTS[0].scalar_mult(SCALARS[0])
+            ge25519_p3.from_hash_ristretto255(bytes(64)) # Nested entry points are not reported.
+            ge25519_p3.from_bytes(p.to_bytes(), field='int')
+            ge25519_p3.to_bytes_ristretto255_many(POINTS)
+            ed25519.verify_batch([bytes(64)] * 2, [b''] * 2, [bytes(32)] * 2)
+            ge25519_p3_batch.from_points(POINTS).to_bytes()
+            with ge25519_pool(processes=1, threads=True) as pool:
+                pool.scalar_mult_base(iter(SCALARS))
+            asyncio.run(ge25519_async(latency=0).scalar_mult_base(SCALARS[0]))
+        finally:
+            ge25519.unregister_hook(hook)
+
+        self.assertEqual(calls, [
+            ('ge25519_p3.scalar_mult', 1),
+            ('ge25519_p3.from_hash_ristretto255', 1),
+            ('ge25519_p3.to_bytes', 1),
+            ('ge25519_p3.from_bytes', 1),
+            ('ge25519_p3.to_bytes_ristretto255_many', 4),
+            ('ed25519.verify_batch', 2),
+            ('ge25519_p3_batch.to_bytes', 4),
+            ('ge25519_pool.scalar_mult_base', 4),
+            ('ge25519_async.scalar_mult_base', 1)
+        ])
+        self.assertIs(vars(ge25519_p3)['scalar_mult'], scalar_mult) # Methods are restored.
+
+        with self.assertRaises(ValueError):
+            ge25519.unregister_hook(hook)
+
+    def test_hook_behavior(self):
+        calls = []
+        def hook(operation, size, _): # Invokes entry points itself.
+            calls.append((operation, size, ge25519_p3.from_bytes(POINTS[0].to_bytes()).to_bytes()))
+        def failing(operation, *_):
+            raise ValueError(operation)
+
+        doc = ge25519_p3.scalar_mult.__doc__
+        for h in [hook, failing]:
+            ge25519.register_hook(h)
+        try:
+            # Metadata of instrumented methods is retained.
+            self.assertEqual(ge25519_p3.scalar_mult.__name__, 'scalar_mult')
+            self.assertEqual(ge25519_p3.scalar_mult.__doc__, doc)
+            self.assertEqual(ed25519.verify_batch.__qualname__, 'ed25519.verify_batch')
+            self.assertEqual(ge25519_async.to_bytes.__name__, 'to_bytes')
+
+            with self.assertWarns(RuntimeWarning):
+                p = POINTS[0].scalar_mult(SCALARS[0])
+            with self.assertWarns(RuntimeWarning):
+                bs = asyncio.run(ge25519_async(latency=0).to_bytes(p))
+        finally:
+            for h in [hook, failing]:
+                ge25519.unregister_hook(h)
+
+        self.assertEqual(bs, POINTS[0].scalar_mult(SCALARS[0]).to_bytes())
+        self.assertEqual(calls, [
+            ('ge25519_p3.scalar_mult', 1, POINTS[0].to_bytes()),
+            ('ge25519_async.to_bytes', 1, POINTS[0].to_bytes())
+        ])
+
+    def test_workers(self):
+        # Entry points invoked by workers (threads of a pool or of an executor)
+        # are not reported, so each top-level invocation is reported once.
+        async def main(executor):
+            async with ge25519_async(executor, latency=0.01, size=2) as facade:
+                ps = await asyncio.gather(*[facade.scalar_mult_base(s) for s in SCALARS])
+                return await asyncio.gather(*[facade.to_bytes(p) for p in ps])
+
+        calls = []
+        hook = lambda operation, size, seconds: calls.append((operation, size))
+        ge25519.register_hook(hook)
+        try:
+            for threads in [True, False]:
+                with ge25519_pool(processes=2, chunksize=1, threads=threads) as pool:
+                    pool.scalar_mult_base(SCALARS)
+                    pool.from_hash_ristretto255(iter([bytes(64)] * 3))
+            asyncio.run(main(None))
+            with concurrent.futures.ThreadPoolExecutor(2) as executor:
+                asyncio.run(main(executor))
+            with ge25519._unreported(): # pylint: disable=protected-access
+                asyncio.run(main(None)) # Within another entry point.
+        finally:
+            ge25519.unregister_hook(hook)
+
+        self.assertEqual(calls[:4], [
+            ('ge25519_pool.scalar_mult_base', 4),
+            ('ge25519_pool.from_hash_ristretto255', 3)
+        ] * 2)
+        self.assertEqual(sorted(calls[4:]), sorted(
+            [('ge25519_async.scalar_mult_base', 1)] * 8 + [('ge25519_async.to_bytes', 1)] * 8
+        ))
+
+    def test_entry_point(self):
+        # pylint: disable=protected-access
+        class example: # pylint: disable=too-few-public-methods
+            """Class with an entry point."""
+            @staticmethod
+            def encode(ps):
+                return ge25519_p3.to_bytes_many(ps)
+
+        encode = vars(example)['encode']
+        with ge25519_telemetry() as telemetry:
+            ge25519._entry_point(example, ['encode'], lambda args, result: len(result))
+            example.encode(POINTS)
+        ge25519._entry_points.pop()
+        self.assertEqual(telemetry.inputs, {'example.encode': 4})
+        self.assertIs(vars(example)['encode'], encode)
+
+    def test_export(self):
+        telemetry = ge25519_telemetry(buckets=[1.0, 0.001])
+        telemetry('a', 2, 0.0001)
+        telemetry('a', 3, 0.01)
+        telemetry('b', 1, 100)
+        self.assertEqual(telemetry.export().split('\n')[8:], [
+            '# HELP ge25519_latency_seconds Elapsed time of each invocation of each entry point.',
+            '# TYPE ge25519_latency_seconds histogram',
+            'ge25519_latency_seconds_bucket{operation="a",le="0.001"} 1',
+            'ge25519_latency_seconds_bucket{operation="a",le="1.0"} 2',
+            'ge25519_latency_seconds_bucket{operation="a",le="+Inf"} 2',
+            'ge25519_latency_seconds_sum{operation="a"} 0.0101',
+            'ge25519_latency_seconds_count{operation="a"} 2',
+            'ge25519_latency_seconds_bucket{operation="b",le="0.001"} 0',
+            'ge25519_latency_seconds_bucket{operation="b",le="1.0"} 0',
+            'ge25519_latency_seconds_bucket{operation="b",le="+Inf"} 1',
+            'ge25519_latency_seconds_sum{operation="b"} 100.0',
+            'ge25519_latency_seconds_count{operation="b"} 1'
+        ])
+        self.assertIn('ge25519_inputs_total{operation="a"} 5', telemetry.export())
+
+    def test_serve(self):
+        telemetry = ge25519_telemetry()
+        telemetry.register()
+        try:
+            ge25519_p3_batch.scalar_mult_base(np.array([list(s) for s in SCALARS], dtype=np.uint8))
+        finally:
+            telemetry.unregister()
+
+        server = telemetry.serve()
+        try:
+            url = 'http://127.0.0.1:' + str(server.server_address[1]) + '/metrics'
+            with urllib.request.urlopen(url) as response:
+                text = response.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(text, telemetry.export() + '\n')
+        self.assertIn('ge25519_inputs_total{operation="ge25519_p3_batch.scalar_mult_base"} 4', text)